@@ -3,21 +3,92 @@ IPTorrents Browser - Flask Web Application
 Provides a better filtering interface for IPTorrents
 """
 
+import atexit
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
+import logging
 import os
+import re
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from operator import itemgetter
 from dotenv import load_dotenv
-from flask import Flask, render_template, jsonify, request
-from scraper import IPTorrentsScraper, CATEGORIES
+from flask import Flask, render_template, jsonify, request, g, has_request_context
+from flask.json.provider import DefaultJSONProvider
 from config_manager import ConfigManager
-from qbittorrent_client import QbittorrentClient, AuthenticationError, ConnectionError, TorrentAddError
-from igdb_client import IGDBClient, IGDB_PLATFORMS
+from constants import CATEGORIES
+
+# scraper, qbittorrent_client and igdb_client (requests, BeautifulSoup) are
+# imported lazily in their getters so startup only loads what is used
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional - much faster cache and API JSON encoding when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyahocorasick is optional - matches all exclude keywords in one pass per name
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+class TorrentJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider for API responses
+
+    Serializes datetimes as ISO strings (instead of Flask's HTTP date format)
+    so API payloads can be passed to jsonify() as-is without copying.
+    Encodes with orjson when it is installed.
+    """
+    sort_keys = False
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        # jsonify() path: hand orjson's bytes straight to the response instead
+        # of decoding to str and re-encoding
+        if not ORJSON_AVAILABLE:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
-app.config['JSON_SORT_KEYS'] = False
+# Key order is set by the provider (sort_keys = False); Flask 2.3+ ignores
+# the old JSON_SORT_KEYS config setting
+app.json = TorrentJSONProvider(app)
 
 # Global config manager and scraper instances
 config_manager = ConfigManager()
@@ -30,6 +101,7 @@ def get_qbt_client():
     """Get or create qBittorrent client instance"""
     global qbt_client
     if qbt_client is None:
+        from qbittorrent_client import QbittorrentClient
         qbt_client = QbittorrentClient(config_manager)
     return qbt_client
 
@@ -38,15 +110,40 @@ def get_igdb_client():
     """Get or create IGDB client instance"""
     global igdb_client
     if igdb_client is None:
+        from igdb_client import IGDBClient
         igdb_client = IGDBClient(config_manager)
     return igdb_client
 
 # Cache configuration
-CACHE_FILE = 'cache.json'
+CACHE_FILE = 'cache.json.gz'  # gzip-compressed JSON
+LEGACY_CACHE_FILE = 'cache.json'  # uncompressed cache from older versions
+CACHE_JOURNAL_FILE = 'cache.journal.jsonl'  # incremental additions since the last full save
+JOURNAL_COMPACT_BATCHES = 50  # fold the journal into CACHE_FILE every N incremental batches
 CACHE_DURATION = 15  # minutes
 DEFAULT_TIME_WINDOW_DAYS = 30  # Default time window for fetching torrents
 
-# Global cache with enhanced metadata structure
+# Torrent size strings like "45.2 GB"
+SIZE_RE = re.compile(r'([\d.]+)\s*(GB|MB|TB)', re.I)
+
+# Set when torrent data changes; save_cache() skips the write otherwise
+cache_dirty = False
+
+# Held while a full or incremental refresh scrapes IPTorrents
+_refresh_lock = threading.Lock()
+
+# Rendered main page (see index())
+_index_html = None
+
+# Background cache writer: save_cache() hands the latest snapshot over and
+# returns; the writer thread only ever writes the newest pending snapshot
+_cache_write_cond = threading.Condition()
+_pending_cache_write = None
+_cache_write_busy = False
+_cache_writer_thread = None
+
+# Global cache with enhanced metadata structure. Refreshes build a new dict
+# and swap it in with one assignment rather than mutating it in place, so
+# requests that grab a reference always see a consistent state.
 torrents_cache = {
     'metadata': {
         'created_at': None,
@@ -54,22 +151,47 @@ torrents_cache = {
         'default_window_days': DEFAULT_TIME_WINDOW_DAYS,
         'categories': {}  # Will store per-category metadata
     },
-    'data': []
+    'data': [],
+    'by_category': {},  # category -> torrents (newest first), not persisted
+    'by_id': {},  # torrent id -> torrent, not persisted
+    'name_lower': {},  # torrent id -> lowercased name (see _derive_keys), not persisted
+    'size_mb': {}  # torrent id -> size in MB (see _derive_keys), not persisted
 }
 
+# Memoized API responses (see cached_response), cleared whenever torrents_cache
+# or memoized settings change
+response_cache = {}
+
+# Generation of response_cache, bumped on every invalidation. Entries are
+# tagged with the generation current when their view started, so a body built
+# from state that was invalidated meanwhile is never served.
+_response_generation_counter = itertools.count(1)
+_response_generation = 0
+
+# (updated_at, computed_at, cache_age string) memo for _get_cache_age()
+CACHE_AGE_MEMO_SECONDS = 30
+_cache_age_memo = (None, 0.0, None)
+
+# (cache state, fetched_new, cache_age, metadata) memo for _get_cache_metadata()
+_cache_metadata_memo = (None, None, None, None)
+
 
 def get_scraper():
     """Get or create scraper instance (for hot reload support)"""
     global scraper_instance
     if scraper_instance is None:
+        from scraper import IPTorrentsScraper
         scraper_instance = IPTorrentsScraper(config_manager=config_manager)
     return scraper_instance
 
 
+@lru_cache(maxsize=4)
 def mask_cookie(cookie_string):
     """
     Mask cookie for security (show first/last 4 chars)
 
+    Memoized: the UI polls the cookie status with the same stored value.
+
     Args:
         cookie_string: Cookie string like "uid=123456; pass=abcdef"
 
@@ -92,95 +214,393 @@ def mask_cookie(cookie_string):
     return '; '.join(parts)
 
 
+def cached_response(timeout=30, unless=None, cache_control=None):
+    """
+    Memoize a view's response body per URL (path + query string)
+
+    Entries expire after `timeout` seconds and are dropped as soon as the
+    torrent cache or related settings change (see invalidate_response_cache),
+    so repeated polls don't rebuild and re-encode the same JSON. Responses
+    carry an ETag (the view's own, or a hash of the body), so clients sending
+    a matching If-None-Match get an empty 304 instead.
+
+    Args:
+        timeout: Seconds a memoized response stays valid
+        unless: Optional callable; when it returns True the view runs uncached
+        cache_control: Optional Cache-Control header for responses that don't
+                       set one
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if unless is not None and unless():
+                return view(*args, **kwargs)
+
+            key = request.full_path
+            generation = _response_generation
+            entry = response_cache.get(key)
+            if entry and entry[5] == generation and time.monotonic() - entry[0] < timeout:
+                _, body, mimetype, etag, stored_cache_control, _ = entry
+                response = app.response_class(body, mimetype=mimetype)
+                response.set_etag(etag)
+                if stored_cache_control:
+                    response.headers['Cache-Control'] = stored_cache_control
+                return response.make_conditional(request)
+
+            response = app.make_response(view(*args, **kwargs))
+            if cache_control and 'Cache-Control' not in response.headers:
+                response.headers['Cache-Control'] = cache_control
+            if response.status_code == 200:
+                body = response.get_data()
+                # Keep an ETag the view set itself, otherwise tag the body
+                etag = response.get_etag()[0] or hashlib.sha1(body).hexdigest()
+                # Skip the store if an invalidation ran while the view was
+                # building the body (an entry stored anyway still carries the
+                # old generation and is ignored above)
+                if generation == _response_generation:
+                    response_cache[key] = (
+                        time.monotonic(), body, response.mimetype, etag,
+                        response.headers.get('Cache-Control'), generation
+                    )
+                response.set_etag(etag)
+                return response.make_conditional(request)
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidate_response_cache():
+    """Drop all memoized API responses (call after torrents_cache or settings change)"""
+    global _response_generation
+    # next() on itertools.count is atomic, so concurrent invalidations never
+    # reuse a generation
+    _response_generation = next(_response_generation_counter)
+    response_cache.clear()
+
+
+@app.before_request
+def _stash_request_time():
+    """Read the clock once per request; helpers share it through _now()"""
+    g.now = datetime.now()
+
+
+def _now():
+    """Current time, taken once per request when called inside one"""
+    if has_request_context() and 'now' in g:
+        return g.now
+    return datetime.now()
+
+
+def _json_default(obj):
+    """Serialize values the JSON encoder doesn't handle natively (datetimes)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_cache_json(data):
+    """Serialize cache data to UTF-8 JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _load_cache_json(raw):
+    """Parse cache JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _to_epoch(value):
+    """Convert a cached timestamp to epoch seconds (ISO strings come from older caches)"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return value
+
+
+def _find_cache_file():
+    """Return the cache file to load (falls back to the legacy uncompressed cache)"""
+    if os.path.exists(CACHE_FILE):
+        return CACHE_FILE
+    if os.path.exists(LEGACY_CACHE_FILE):
+        return LEGACY_CACHE_FILE
+    return None
+
+
+def _read_cache_file(path):
+    """Read raw cache bytes, decompressing gzip files"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        return f.read()
+
+
 def load_cache():
     """Load torrents from cache file with migration from old format"""
-    global torrents_cache
+    global torrents_cache, cache_dirty
 
-    if os.path.exists(CACHE_FILE):
+    cache_path = _find_cache_file()
+    if cache_path:
         try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-                # Check if this is old format (has 'timestamp' at root level)
-                if 'timestamp' in data and 'metadata' not in data:
-                    print("Migrating cache from old format to new format...")
-                    # Old format - migrate to new structure
-                    torrents_data = data.get('data', [])
-
-                    # Convert timestamp strings back to datetime for torrents
-                    for torrent in torrents_data:
-                        if 'timestamp' in torrent:
-                            torrent['timestamp'] = datetime.fromisoformat(torrent['timestamp'])
-
-                    # Build metadata from existing data
-                    cache_timestamp = datetime.fromisoformat(data['timestamp']) if data.get('timestamp') else None
-                    categories_meta = _build_category_metadata(torrents_data)
-
-                    torrents_cache = {
-                        'metadata': {
-                            'created_at': cache_timestamp,
-                            'updated_at': cache_timestamp,
-                            'default_window_days': DEFAULT_TIME_WINDOW_DAYS,
-                            'categories': categories_meta
-                        },
-                        'data': torrents_data
-                    }
-
-                    # Save migrated cache
+            data = _load_cache_json(_read_cache_file(cache_path))
+
+            # Check if this is old format (has 'timestamp' at root level)
+            if 'timestamp' in data and 'metadata' not in data:
+                print("Migrating cache from old format to new format...")
+                # Old format - migrate to new structure
+                torrents_data = data.get('data', [])
+
+                # Convert ISO timestamp strings to epoch seconds
+                for torrent in torrents_data:
+                    if 'timestamp' in torrent:
+                        torrent['timestamp'] = _to_epoch(torrent['timestamp'])
+                name_lower, size_mb = _derive_keys(torrents_data)
+
+                # Build metadata from existing data
+                cache_timestamp = datetime.fromisoformat(data['timestamp']) if data.get('timestamp') else None
+                categories_meta = _build_category_metadata(torrents_data)
+
+                torrents_cache = {
+                    'metadata': {
+                        'created_at': cache_timestamp,
+                        'updated_at': cache_timestamp,
+                        'default_window_days': DEFAULT_TIME_WINDOW_DAYS,
+                        'categories': categories_meta
+                    },
+                    'data': torrents_data,
+                    'by_category': _build_category_index(torrents_data),
+                    'by_id': _build_id_index(torrents_data),
+                    'name_lower': name_lower,
+                    'size_mb': size_mb
+                }
+
+                # Save migrated cache
+                cache_dirty = True
+                save_cache()
+                print(f"Migrated {len(torrents_data)} torrents to new cache format")
+
+            else:
+                # New format - load directly
+                torrents_data = data.get('data', [])
+
+                # Convert ISO timestamp strings to epoch seconds
+                for torrent in torrents_data:
+                    if 'timestamp' in torrent:
+                        torrent['timestamp'] = _to_epoch(torrent['timestamp'])
+
+                # Caches written by older versions stored the derived keys on
+                # each torrent; _derive_keys drops them, so rewrite the file
+                has_legacy_keys = bool(torrents_data) and '_name_lower' in torrents_data[0]
+                name_lower, size_mb = _derive_keys(torrents_data)
+
+                # Load metadata
+                metadata = data.get('metadata', {})
+                if 'created_at' in metadata and metadata['created_at']:
+                    metadata['created_at'] = datetime.fromisoformat(metadata['created_at'])
+                if 'updated_at' in metadata and metadata['updated_at']:
+                    metadata['updated_at'] = datetime.fromisoformat(metadata['updated_at'])
+
+                # Convert ISO timestamp strings in category metadata (older caches)
+                for cat_meta in metadata.get('categories', {}).values():
+                    if 'newest_timestamp' in cat_meta and cat_meta['newest_timestamp']:
+                        cat_meta['newest_timestamp'] = _to_epoch(cat_meta['newest_timestamp'])
+                    if 'oldest_timestamp' in cat_meta and cat_meta['oldest_timestamp']:
+                        cat_meta['oldest_timestamp'] = _to_epoch(cat_meta['oldest_timestamp'])
+
+                torrents_cache = {
+                    'metadata': metadata,
+                    'data': torrents_data,
+                    'by_category': _build_category_index(torrents_data),
+                    'by_id': _build_id_index(torrents_data),
+                    'name_lower': name_lower,
+                    'size_mb': size_mb
+                }
+
+                print(f"Loaded {len(torrents_data)} torrents from cache (new format)")
+
+                if has_legacy_keys:
+                    cache_dirty = True
                     save_cache()
-                    print(f"Migrated {len(torrents_data)} torrents to new cache format")
-
-                else:
-                    # New format - load directly
-                    torrents_data = data.get('data', [])
-
-                    # Convert timestamp strings back to datetime for torrents
-                    for torrent in torrents_data:
-                        if 'timestamp' in torrent:
-                            torrent['timestamp'] = datetime.fromisoformat(torrent['timestamp'])
-
-                    # Load metadata
-                    metadata = data.get('metadata', {})
-                    if 'created_at' in metadata and metadata['created_at']:
-                        metadata['created_at'] = datetime.fromisoformat(metadata['created_at'])
-                    if 'updated_at' in metadata and metadata['updated_at']:
-                        metadata['updated_at'] = datetime.fromisoformat(metadata['updated_at'])
-
-                    # Convert timestamp strings in category metadata
-                    for cat_meta in metadata.get('categories', {}).values():
-                        if 'newest_timestamp' in cat_meta and cat_meta['newest_timestamp']:
-                            cat_meta['newest_timestamp'] = datetime.fromisoformat(cat_meta['newest_timestamp'])
-                        if 'oldest_timestamp' in cat_meta and cat_meta['oldest_timestamp']:
-                            cat_meta['oldest_timestamp'] = datetime.fromisoformat(cat_meta['oldest_timestamp'])
-
-                    torrents_cache = {
-                        'metadata': metadata,
-                        'data': torrents_data
-                    }
-
-                    print(f"Loaded {len(torrents_data)} torrents from cache (new format)")
 
         except Exception as e:
             print(f"Error loading cache: {e}")
+            return
+
+    # Replayed even without a cache file: refreshes into an empty cache
+    # journal their batches before the first full save reaches disk
+    try:
+        _replay_cache_journal()
+    except Exception as e:
+        print(f"Error replaying cache journal: {e}")
+    invalidate_response_cache()
+
+
+def _size_to_mb(size_str):
+    """Parse a size string like "45.2 GB" to megabytes (0 if unparseable)"""
+    match = SIZE_RE.search(size_str or '')
+    if not match:
+        return 0
+    value = float(match.group(1))
+    unit = match.group(2).upper()
+    if unit == 'GB':
+        return value * 1024
+    elif unit == 'TB':
+        return value * 1024 * 1024
+    return value
+
+
+def _derive_keys(torrents, name_lower=None, size_mb=None):
+    """
+    Precompute the lowercased names and sizes in MB used by filtering and sorting
+
+    Called once when torrents enter the cache so per-request filters and
+    sorts don't re-lowercase every name or re-parse every size string.
+    The values live in side indexes keyed by torrent id (kept in the cache
+    state next to by_id) instead of on the torrent dicts, so they never
+    reach API responses or the cache file. Copies that older versions
+    stored on the dicts are dropped here.
+
+    Args:
+        torrents: Torrents entering the cache
+        name_lower, size_mb: Existing indexes to extend in place (optional)
+
+    Returns:
+        tuple: (name_lower, size_mb) indexes
+    """
+    if name_lower is None:
+        name_lower = {}
+    if size_mb is None:
+        size_mb = {}
+    for torrent in torrents:
+        torrent.pop('_name_lower', None)
+        torrent.pop('_size_mb', None)
+        torrent_id = torrent.get('id')
+        if torrent_id:
+            name_lower[torrent_id] = torrent['name'].lower()
+            size_mb[torrent_id] = _size_to_mb(torrent.get('size'))
+    return name_lower, size_mb
+
+
+def _name_lower_key(cache):
+    """Key function returning a torrent's lowercased name from the cache's index"""
+    name_lower = cache.get('name_lower', {})
+
+    def key(torrent):
+        value = name_lower.get(torrent['id'])
+        # Torrents without an id (or from another cache state) are computed on the fly
+        return value if value is not None else torrent['name'].lower()
+
+    return key
+
+
+def _size_mb_key(cache):
+    """Key function returning a torrent's size in MB from the cache's index"""
+    size_mb = cache.get('size_mb', {})
+
+    def key(torrent):
+        value = size_mb.get(torrent['id'])
+        return value if value is not None else _size_to_mb(torrent.get('size'))
+
+    return key
+
+
+def _build_category_index(torrents):
+    """Group torrents by category, keeping each group in the input (newest first) order"""
+    by_category = {}
+    for torrent in torrents:
+        by_category.setdefault(torrent.get('category'), []).append(torrent)
+    return by_category
+
+
+def _ingest_torrents(torrents):
+    """
+    Prepare freshly scraped torrents for the cache in a single pass
+
+    Drops duplicate IDs (keeping the first occurrence) and builds the id
+    index, derived-key indexes (see _derive_keys), per-category index and
+    category metadata along the way.
+
+    Returns:
+        tuple: (deduplicated list, by_id, by_category, categories metadata,
+                name_lower, size_mb)
+    """
+    seen = {}
+    deduplicated = []
+    by_category = {}
+    categories_meta = {}
+    name_lower = {}
+    size_mb = {}
+
+    for torrent in torrents:
+        if torrent['id'] in seen:
+            continue
+        seen[torrent['id']] = torrent
+        deduplicated.append(torrent)
+
+        if torrent['id']:
+            name_lower[torrent['id']] = torrent['name'].lower()
+            size_mb[torrent['id']] = _size_to_mb(torrent.get('size'))
+
+        cat = torrent.get('category')
+        by_category.setdefault(cat, []).append(torrent)
+        if not cat:
+            continue
+
+        timestamp = torrent['timestamp']
+        cat_meta = categories_meta.get(cat)
+        if cat_meta is None:
+            categories_meta[cat] = {'newest_timestamp': timestamp, 'oldest_timestamp': timestamp, 'count': 1}
+            continue
+        cat_meta['count'] += 1
+        if timestamp > cat_meta['newest_timestamp']:
+            cat_meta['newest_timestamp'] = timestamp
+        if timestamp < cat_meta['oldest_timestamp']:
+            cat_meta['oldest_timestamp'] = timestamp
+
+    seen.pop(None, None)
+    return deduplicated, seen, by_category, categories_meta, name_lower, size_mb
+
+
+def _build_id_index(torrents):
+    """Map torrent id -> torrent (torrents without an id are left out)"""
+    return {torrent['id']: torrent for torrent in torrents if torrent.get('id')}
 
 
 def _build_category_metadata(torrents):
     """Build category metadata from torrent data"""
-    categories_meta = {}
+    return _update_category_metadata({}, torrents)
+
+
+def _update_category_metadata(categories_meta, torrents):
+    """
+    Return category metadata with the given torrents added
+
+    Only the new torrents are scanned (counts and newest/oldest timestamps are
+    running values). The input is left untouched since it may belong to the
+    published cache state; touched categories are copied.
+    """
+    touched = {}
 
     for torrent in torrents:
         cat = torrent.get('category')
         if not cat:
             continue
 
-        if cat not in categories_meta:
-            categories_meta[cat] = {
-                'newest_timestamp': torrent['timestamp'],
-                'oldest_timestamp': torrent['timestamp'],
-                'count': 0
-            }
+        # One lookup per torrent; a category's entry is copied (or created)
+        # the first time it is touched
+        cat_meta = touched.get(cat)
+        if cat_meta is None:
+            existing = categories_meta.get(cat)
+            if existing:
+                cat_meta = dict(existing)
+            else:
+                cat_meta = {
+                    'newest_timestamp': torrent['timestamp'],
+                    'oldest_timestamp': torrent['timestamp'],
+                    'count': 0
+                }
+            touched[cat] = cat_meta
 
-        cat_meta = categories_meta[cat]
         cat_meta['count'] += 1
 
         # Update newest/oldest timestamps
@@ -189,55 +609,199 @@ def _build_category_metadata(torrents):
         if torrent['timestamp'] < cat_meta['oldest_timestamp']:
             cat_meta['oldest_timestamp'] = torrent['timestamp']
 
-    return categories_meta
+    return {**categories_meta, **touched}
 
 
 def save_cache():
-    """Save torrents to cache file with metadata"""
-    try:
-        # Convert datetime objects to ISO strings for JSON serialization
-        cache_data = {
-            'metadata': {
-                'created_at': None,
-                'updated_at': None,
-                'default_window_days': DEFAULT_TIME_WINDOW_DAYS,
-                'categories': {}
-            },
-            'data': []
-        }
+    """
+    Save torrents to cache file with metadata
 
-        # Convert metadata timestamps
-        metadata = torrents_cache.get('metadata', {})
-        if metadata.get('created_at'):
-            cache_data['metadata']['created_at'] = metadata['created_at'].isoformat()
-        if metadata.get('updated_at'):
-            cache_data['metadata']['updated_at'] = metadata['updated_at'].isoformat()
-
-        cache_data['metadata']['default_window_days'] = metadata.get('default_window_days', DEFAULT_TIME_WINDOW_DAYS)
-
-        # Convert category metadata timestamps
-        for cat, cat_meta in metadata.get('categories', {}).items():
-            cache_data['metadata']['categories'][cat] = {
-                'newest_timestamp': cat_meta['newest_timestamp'].isoformat() if cat_meta.get('newest_timestamp') else None,
-                'oldest_timestamp': cat_meta['oldest_timestamp'].isoformat() if cat_meta.get('oldest_timestamp') else None,
-                'count': cat_meta.get('count', 0)
-            }
+    Skipped when nothing changed since the last save. The file itself is
+    written by a background thread (see _cache_writer_loop), so refreshes
+    don't wait on compression and disk I/O; saves requested while a write
+    is in progress are coalesced into one write of the newest state.
+    """
+    global cache_dirty, _pending_cache_write, _cache_writer_thread
+
+    if not cache_dirty:
+        return
+
+    # Torrent timestamps are epoch seconds and the remaining datetimes are
+    # serialized by the encoder, so torrents are written as-is. The data list
+    # is replaced (never mutated) on refresh, so holding a reference is a
+    # consistent snapshot; category metadata is copied.
+    metadata = torrents_cache.get('metadata', {})
+    cache_data = {
+        'metadata': {
+            'created_at': metadata.get('created_at'),
+            'updated_at': metadata.get('updated_at'),
+            'default_window_days': metadata.get('default_window_days', DEFAULT_TIME_WINDOW_DAYS),
+            'categories': {cat: dict(meta) for cat, meta in metadata.get('categories', {}).items()},
+            'journal_seq': metadata.get('journal_seq', 0)
+        },
+        'data': torrents_cache['data']
+    }
+    cache_dirty = False
 
-        # Convert torrent timestamps
-        for torrent in torrents_cache['data']:
-            torrent_copy = torrent.copy()
-            if 'timestamp' in torrent_copy:
-                torrent_copy['timestamp'] = torrent_copy['timestamp'].isoformat()
-            cache_data['data'].append(torrent_copy)
+    with _cache_write_cond:
+        _pending_cache_write = cache_data
+        if _cache_writer_thread is None:
+            _cache_writer_thread = threading.Thread(
+                target=_cache_writer_loop, name='cache-writer', daemon=True
+            )
+            _cache_writer_thread.start()
+        _cache_write_cond.notify_all()
 
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
 
-        print(f"Saved {len(torrents_cache['data'])} torrents to cache")
+def _write_cache_file(cache_data):
+    """
+    Write a cache snapshot to disk
+
+    Written as compact gzip (level 1) JSON to a temp file, then swapped into
+    place so a crash mid-write can't leave a truncated cache behind.
+    """
+    global cache_dirty
+
+    try:
+        payload = _dump_cache_json(cache_data)
+        tmp_file = CACHE_FILE + '.tmp'
+        with gzip.open(tmp_file, 'wb', compresslevel=1) as f:
+            f.write(payload)
+        os.replace(tmp_file, CACHE_FILE)
+
+        # The journal can go once the file holds every batch appended so far
+        # (appends take the same lock, so none can slip in between)
+        with _cache_write_cond:
+            saved_seq = cache_data['metadata'].get('journal_seq', 0)
+            if torrents_cache['metadata'].get('journal_seq', 0) == saved_seq and os.path.exists(CACHE_JOURNAL_FILE):
+                os.remove(CACHE_JOURNAL_FILE)
+
+        print(f"Saved {len(cache_data['data'])} torrents to cache")
     except Exception as e:
+        # Leave the cache marked dirty so the next save retries
+        cache_dirty = True
         print(f"Error saving cache: {e}")
 
 
+def _cache_writer_loop():
+    """Background thread: write pending cache snapshots, newest only"""
+    global _pending_cache_write, _cache_write_busy
+
+    while True:
+        with _cache_write_cond:
+            while _pending_cache_write is None:
+                _cache_write_cond.wait()
+            cache_data = _pending_cache_write
+            _pending_cache_write = None
+            _cache_write_busy = True
+
+        try:
+            _write_cache_file(cache_data)
+        finally:
+            with _cache_write_cond:
+                _cache_write_busy = False
+                _cache_write_cond.notify_all()
+
+
+@atexit.register
+def flush_cache_writes(timeout=30):
+    """
+    Fold the journal into the cache file and wait for pending background
+    cache writes (runs at interpreter exit)
+    """
+    global cache_dirty
+
+    if torrents_cache['data'] and os.path.exists(CACHE_JOURNAL_FILE):
+        cache_dirty = True
+        save_cache()
+
+    with _cache_write_cond:
+        _cache_write_cond.wait_for(
+            lambda: _pending_cache_write is None and not _cache_write_busy,
+            timeout=timeout
+        )
+
+
+def append_cache(torrents, seq, updated_at):
+    """
+    Append an incremental batch to the cache journal
+
+    Writes only the new torrents (one JSON line per batch) instead of
+    rewriting the whole cache file; load_cache replays batches newer than
+    the file's journal_seq and the next full save drops the journal.
+
+    Returns:
+        bool: True if the batch was written
+    """
+    line = _dump_cache_json({'seq': seq, 'updated_at': updated_at, 'torrents': torrents}) + b'\n'
+    try:
+        with _cache_write_cond:
+            with open(CACHE_JOURNAL_FILE, 'ab') as f:
+                f.write(line)
+        return True
+    except Exception as e:
+        print(f"Error appending to cache journal: {e}")
+        return False
+
+
+def _replay_cache_journal():
+    """
+    Apply journal batches newer than the loaded cache file to torrents_cache
+
+    Returns:
+        int: Number of torrents added from the journal
+    """
+    global torrents_cache, cache_dirty
+
+    if not os.path.exists(CACHE_JOURNAL_FILE):
+        return 0
+
+    metadata = torrents_cache['metadata']
+    seq = metadata.get('journal_seq', 0)
+    by_id = torrents_cache['by_id']
+    added_torrents = []
+
+    with open(CACHE_JOURNAL_FILE, 'rb') as f:
+        for line in f:
+            try:
+                batch = _load_cache_json(line)
+            except ValueError:
+                # Torn line from an interrupted append
+                continue
+            if batch.get('seq', 0) <= seq:
+                continue
+            seq = batch['seq']
+            if batch.get('updated_at'):
+                metadata['updated_at'] = datetime.fromisoformat(batch['updated_at'])
+            for t in batch.get('torrents', []):
+                if t.get('id') in by_id:
+                    continue
+                added_torrents.append(t)
+                if t.get('id'):
+                    by_id[t['id']] = t
+
+    metadata['journal_seq'] = seq
+    if added_torrents:
+        name_lower, size_mb = _derive_keys(added_torrents, torrents_cache['name_lower'], torrents_cache['size_mb'])
+        data = sorted(torrents_cache['data'] + added_torrents, key=itemgetter('timestamp'), reverse=True)
+        metadata['categories'] = _build_category_metadata(data)
+        torrents_cache = {
+            'metadata': metadata,
+            'data': data,
+            'by_category': _build_category_index(data),
+            'by_id': by_id,
+            'name_lower': name_lower,
+            'size_mb': size_mb
+        }
+
+    # Fold the replayed batches into the cache file
+    cache_dirty = True
+    save_cache()
+
+    print(f"Replayed {len(added_torrents)} torrents from cache journal")
+    return len(added_torrents)
+
+
 def is_cache_valid():
     """Check if cache is still valid"""
     metadata = torrents_cache.get('metadata', {})
@@ -246,7 +810,7 @@ def is_cache_valid():
     if not updated_at:
         return False
 
-    age = datetime.now() - updated_at
+    age = _now() - updated_at
     return age < timedelta(minutes=CACHE_DURATION)
 
 
@@ -263,8 +827,6 @@ def refresh_torrents(mode='full', categories=None, days=None, force=False):
     Returns:
         tuple: (torrents list, metadata dict)
     """
-    global torrents_cache
-
     # Default categories if not specified
     if categories is None:
         categories = ['PC-ISO', 'PC-Rip']
@@ -278,6 +840,22 @@ def refresh_torrents(mode='full', categories=None, days=None, force=False):
         print("Using cached data (cache-only mode)")
         return torrents_cache['data'], _get_cache_metadata()
 
+    # Only one scrape runs at a time; requests arriving during a slow fetch
+    # get the current cache instead of starting another scrape
+    if not _refresh_lock.acquire(blocking=False):
+        print("Refresh already in progress, using cached data")
+        return torrents_cache['data'], _get_cache_metadata()
+
+    try:
+        return _refresh_torrents_locked(mode, categories, days, force)
+    finally:
+        _refresh_lock.release()
+
+
+def _refresh_torrents_locked(mode, categories, days, force):
+    """Incremental/full part of refresh_torrents (caller holds _refresh_lock)"""
+    global torrents_cache, cache_dirty
+
     # Mode: incremental - fetch only new torrents
     if mode == 'incremental':
         if not force:
@@ -293,8 +871,12 @@ def refresh_torrents(mode='full', categories=None, days=None, force=False):
             scraper = get_scraper()
             torrents = scraper.fetch_torrents(categories=categories, days=days)
 
-            # Build category metadata
-            categories_meta = _build_category_metadata(torrents)
+            # Deduplicate by torrent ID before caching (safety check, keeps first
+            # occurrence) and build the indexes and category metadata in one pass
+            deduplicated, by_id, by_category, categories_meta, name_lower, size_mb = _ingest_torrents(torrents)
+
+            if len(deduplicated) < len(torrents):
+                print(f"  [SAFETY] Removed {len(torrents) - len(deduplicated)} duplicate torrents before caching")
 
             # Update cache with new data
             now = datetime.now()
@@ -303,25 +885,26 @@ def refresh_torrents(mode='full', categories=None, days=None, force=False):
             # Preserve created_at if it exists
             created_at = metadata.get('created_at', now)
 
-            torrents_cache['metadata'] = {
-                'created_at': created_at,
-                'updated_at': now,
-                'default_window_days': days,
-                'categories': categories_meta
+            # Publish the new state with a single assignment so concurrent
+            # requests see either the old or the new cache, never a mix
+            torrents_cache = {
+                'metadata': {
+                    'created_at': created_at,
+                    'updated_at': now,
+                    'default_window_days': days,
+                    'categories': categories_meta,
+                    # Keeps counting so older journal batches are never replayed
+                    'journal_seq': metadata.get('journal_seq', 0)
+                },
+                'data': deduplicated,
+                'by_category': by_category,
+                'by_id': by_id,
+                'name_lower': name_lower,
+                'size_mb': size_mb
             }
+            invalidate_response_cache()
 
-            # Deduplicate by torrent ID before caching (safety check)
-            unique_torrents = {}
-            for t in torrents:
-                if t['id'] not in unique_torrents:
-                    unique_torrents[t['id']] = t
-
-            deduplicated = list(unique_torrents.values())
-            if len(deduplicated) < len(torrents):
-                print(f"  [SAFETY] Removed {len(torrents) - len(deduplicated)} duplicate torrents before caching")
-
-            torrents_cache['data'] = deduplicated
-
+            cache_dirty = True
             save_cache()
 
             return deduplicated, _get_cache_metadata(fetched_new=len(deduplicated))
@@ -346,7 +929,7 @@ def _incremental_refresh(categories):
     Returns:
         int: Number of new torrents added
     """
-    global torrents_cache
+    global torrents_cache, cache_dirty
 
     try:
         # Get newest timestamps for each category from cache
@@ -358,32 +941,74 @@ def _incremental_refresh(categories):
             if cat in categories_meta:
                 newest_timestamps[cat] = categories_meta[cat].get('newest_timestamp')
 
-        # Fetch incremental updates
+        # Fetch incremental updates (the scraper drops torrents already cached)
+        by_id = torrents_cache.get('by_id')
+        if by_id is None:
+            by_id = _build_id_index(torrents_cache['data'])
         scraper = get_scraper()
-        new_torrents = scraper.fetch_incremental(categories, newest_timestamps)
+        new_torrents = scraper.fetch_incremental(categories, newest_timestamps, known_ids=by_id)
 
         if not new_torrents:
             print("  No new torrents found")
             return 0
 
-        # Merge new torrents with existing data
-        existing_ids = {t['id'] for t in torrents_cache['data'] if t.get('id')}
-
-        added = 0
-        for torrent in new_torrents:
-            if torrent['id'] not in existing_ids:
-                torrents_cache['data'].append(torrent)
-                added += 1
-
-        # Sort by timestamp (newest first)
-        torrents_cache['data'].sort(key=lambda x: x['timestamp'], reverse=True)
-
-        # Update metadata
-        categories_meta = _build_category_metadata(torrents_cache['data'])
-        torrents_cache['metadata']['updated_at'] = datetime.now()
-        torrents_cache['metadata']['categories'] = categories_meta
+        # Merge new torrents with existing data; the id check only guards
+        # against duplicates within the fetched batch now
+        added_torrents = []
+        added_ids = {}
+        for t in new_torrents:
+            if t['id'] in by_id or t['id'] in added_ids:
+                continue
+            added_torrents.append(t)
+            if t['id']:
+                added_ids[t['id']] = t
+        added = len(added_torrents)
+
+        # Extra ids are harmless to readers of the current state, so the
+        # derived-key indexes are extended in place as well
+        name_lower, size_mb = _derive_keys(added_torrents, torrents_cache['name_lower'], torrents_cache['size_mb'])
+
+        # Cached lists are kept newest first, so merge the (few) new torrents
+        # in with one linear pass instead of re-sorting the whole cache
+        by_timestamp = itemgetter('timestamp')
+        added_torrents.sort(key=by_timestamp, reverse=True)
+        data = list(heapq.merge(
+            torrents_cache['data'], added_torrents, key=by_timestamp, reverse=True
+        ))
+
+        by_category = dict(torrents_cache.get('by_category', {}))
+        for cat, cat_added in _build_category_index(added_torrents).items():
+            by_category[cat] = list(heapq.merge(
+                by_category.get(cat, []), cat_added, key=by_timestamp, reverse=True
+            ))
+
+        # Publish the merged state (with updated metadata) in one assignment;
+        # requests holding the previous state keep a consistent view
+        updated_at = datetime.now()
+        journal_seq = cache_meta.get('journal_seq', 0) + (1 if added else 0)
+        torrents_cache = {
+            'metadata': {
+                **cache_meta,
+                'updated_at': updated_at,
+                'categories': _update_category_metadata(cache_meta.get('categories', {}), added_torrents),
+                'journal_seq': journal_seq
+            },
+            'data': data,
+            'by_category': by_category,
+            'by_id': by_id,
+            'name_lower': name_lower,
+            'size_mb': size_mb
+        }
+        # Only refreshes read the id index, so it is extended in place
+        by_id.update(added_ids)
+        invalidate_response_cache()
 
-        save_cache()
+        # Persist only the new torrents; the whole file is rewritten every
+        # JOURNAL_COMPACT_BATCHES batches (or if the append fails)
+        if added:
+            if journal_seq % JOURNAL_COMPACT_BATCHES == 0 or not append_cache(added_torrents, journal_seq, updated_at):
+                cache_dirty = True
+                save_cache()
 
         print(f"  Added {added} new torrents")
         return added
@@ -393,26 +1018,100 @@ def _incremental_refresh(categories):
         return 0
 
 
+def _get_cache_age():
+    """
+    Get human-readable cache age ("5 minutes ago")
+
+    The string only changes once a minute, so it is memoized for
+    CACHE_AGE_MEMO_SECONDS (or until the cache is updated) instead of being
+    rebuilt on every polled API response.
+    """
+    global _cache_age_memo
+
+    updated_at = torrents_cache.get('metadata', {}).get('updated_at')
+    if not updated_at:
+        return None
+
+    memo_updated_at, computed_at, cache_age = _cache_age_memo
+    now = time.monotonic()
+    if memo_updated_at == updated_at and now - computed_at < CACHE_AGE_MEMO_SECONDS:
+        return cache_age
+
+    age_seconds = (_now() - updated_at).total_seconds()
+    age_minutes = int(age_seconds / 60)
+    if age_minutes < 60:
+        cache_age = f"{age_minutes} minutes ago"
+    else:
+        cache_age = f"{int(age_minutes / 60)} hours ago"
+
+    _cache_age_memo = (updated_at, now, cache_age)
+    return cache_age
+
+
 def _get_cache_metadata(fetched_new=0):
-    """Get cache metadata for API responses"""
-    metadata = torrents_cache.get('metadata', {})
-    updated_at = metadata.get('updated_at')
+    """
+    Get cache metadata for API responses
 
-    cache_age = None
-    if updated_at:
-        age_seconds = (datetime.now() - updated_at).total_seconds()
-        age_minutes = int(age_seconds / 60)
-        if age_minutes < 60:
-            cache_age = f"{age_minutes} minutes ago"
-        else:
-            cache_age = f"{int(age_minutes / 60)} hours ago"
+    Reused until the cache state is replaced (refreshes publish a new
+    torrents_cache dict) or the cache age string changes.
+    """
+    global _cache_metadata_memo
+
+    cache = torrents_cache
+    cache_age = _get_cache_age()
+
+    memo_cache, memo_fetched_new, memo_cache_age, result = _cache_metadata_memo
+    if memo_cache is cache and memo_fetched_new == fetched_new and memo_cache_age == cache_age:
+        return result
 
-    return {
+    metadata = cache.get('metadata', {})
+    result = {
         'cache_age': cache_age,
         'categories': {k: {'count': v.get('count', 0)} for k, v in metadata.get('categories', {}).items()},
         'fetched_new': fetched_new,
-        'total_torrents': len(torrents_cache['data'])
+        'total_torrents': len(cache['data'])
     }
+    _cache_metadata_memo = (cache, fetched_new, cache_age, result)
+    return result
+
+
+def _merge_newest_first(groups):
+    """Merge newest-first torrent lists into a single newest-first list"""
+    if len(groups) == 1:
+        return list(groups[0])
+    return list(heapq.merge(*groups, key=itemgetter('timestamp'), reverse=True))
+
+
+def _newest_first_cutoff(torrents, cutoff_timestamp):
+    """Binary search a newest-first list for the index of the first torrent older than cutoff"""
+    lo, hi = 0, len(torrents)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if torrents[mid]['timestamp'] < cutoff_timestamp:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+# Minimum number of exclude keywords before the Aho-Corasick matcher is used
+AUTOMATON_MIN_KEYWORDS = 3
+
+
+@lru_cache(maxsize=32)
+def _build_keyword_automaton(keywords):
+    """Build (and cache) an Aho-Corasick automaton for a tuple of keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=32)
+def _build_keyword_pattern(keywords):
+    """Compile (and cache) a regex alternation of keywords (fallback without pyahocorasick)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
 
 
 def filter_torrents(torrents, filters):
@@ -425,6 +1124,8 @@ def filter_torrents(torrents, filters):
         - min_snatched: Minimum snatched count
         - exclude: Comma-separated keywords to exclude
         - search: Search query for torrent names
+
+    Returns the input list itself when no filter applies.
     """
     # Pre-calculate filter conditions for efficiency
     cat_set = None
@@ -444,7 +1145,7 @@ def filter_torrents(torrents, filters):
     if 'days' in filters and filters['days']:
         try:
             days = int(filters['days'])
-            cutoff_timestamp = datetime.now() - timedelta(days=days)
+            cutoff_timestamp = (_now() - timedelta(days=days)).timestamp()
         except ValueError:
             pass
 
@@ -459,10 +1160,49 @@ def filter_torrents(torrents, filters):
     if 'exclude' in filters and filters['exclude']:
         exclude_keywords = [kw.strip().lower() for kw in filters['exclude'].split(',') if kw.strip()]
 
+    # Single automaton (or compiled alternation) scan per name instead of one
+    # substring check per keyword (for one or two keywords plain substring
+    # checks are cheaper)
+    exclude_automaton = None
+    exclude_pattern = None
+    if len(exclude_keywords or ()) >= AUTOMATON_MIN_KEYWORDS:
+        if AHOCORASICK_AVAILABLE:
+            exclude_automaton = _build_keyword_automaton(tuple(exclude_keywords))
+        else:
+            exclude_pattern = _build_keyword_pattern(tuple(exclude_keywords))
+
     # Prepare search query
     if 'search' in filters and filters['search']:
         search_query = filters['search'].lower()
 
+    # When filtering the whole cache, narrow the candidates with its indexes:
+    # per-category lists replace the category check and a binary search on
+    # the newest-first lists replaces the date check
+    cache = torrents_cache
+    if torrents is cache['data'] and (cat_set or cutoff_timestamp):
+        by_category = cache.get('by_category', {})
+        if cat_set and not by_category.keys() <= cat_set:
+            groups = [by_category[c] for c in cat_set if c in by_category]
+        else:
+            # Every cached category was requested: the whole list matches
+            groups = [torrents]
+        cat_set = None
+
+        if cutoff_timestamp:
+            groups = [g[:_newest_first_cutoff(g, cutoff_timestamp)] for g in groups]
+            cutoff_timestamp = None
+
+        if len(groups) != 1 or groups[0] is not torrents:
+            torrents = _merge_newest_first(groups)
+
+    # Nothing left to check per torrent (no filters, or only ones the indexes
+    # already applied): skip the scan
+    if not (cat_set or cutoff_timestamp or min_snatched_val is not None or exclude_keywords or search_query):
+        return torrents
+
+    # Lowercased names come from the index built at ingest (see _derive_keys)
+    get_name_lower = _name_lower_key(torrents_cache)
+
     # Single-pass filtering (more efficient than multiple list comprehensions)
     filtered = []
     for t in torrents:
@@ -480,13 +1220,19 @@ def filter_torrents(torrents, filters):
 
         # Exclude keywords filter
         if exclude_keywords:
-            name_lower = t['name'].lower()
-            if any(keyword in name_lower for keyword in exclude_keywords):
+            name_lower = get_name_lower(t)
+            if exclude_automaton is not None:
+                if next(exclude_automaton.iter(name_lower), None) is not None:
+                    continue
+            elif exclude_pattern is not None:
+                if exclude_pattern.search(name_lower):
+                    continue
+            elif any(keyword in name_lower for keyword in exclude_keywords):
                 continue
 
         # Search query filter
         if search_query:
-            if search_query not in t['name'].lower():
+            if search_query not in get_name_lower(t):
                 continue
 
         filtered.append(t)
@@ -494,7 +1240,22 @@ def filter_torrents(torrents, filters):
     return filtered
 
 
-def sort_torrents(torrents, sort_by='snatched', order='desc'):
+# Sort key per sort field
+SORT_KEYS = {
+    'snatched': itemgetter('snatched'),
+    'date': itemgetter('timestamp'),
+    'seeders': itemgetter('seeders')
+}
+
+# Sort fields whose key comes from an index precomputed at ingest (see
+# _derive_keys); each entry builds the key function for a cache state
+DERIVED_SORT_KEYS = {
+    'name': _name_lower_key,
+    'size': _size_mb_key
+}
+
+
+def sort_torrents(torrents, sort_by='snatched', order='desc', limit=None):
     """
     Sort torrents by specified field
 
@@ -502,44 +1263,50 @@ def sort_torrents(torrents, sort_by='snatched', order='desc'):
         torrents: List of torrents
         sort_by: Field to sort by (snatched, date, size, seeders, name)
         order: Sort order (asc or desc)
+        limit: Only return the top N torrents (None or N <= 0 = all). Uses a
+               heap selection instead of a full sort when N < len(torrents).
     """
     reverse = (order == 'desc')
 
-    if sort_by == 'snatched':
-        return sorted(torrents, key=lambda x: x['snatched'], reverse=reverse)
-    elif sort_by == 'date':
-        return sorted(torrents, key=lambda x: x['timestamp'], reverse=reverse)
-    elif sort_by == 'seeders':
-        return sorted(torrents, key=lambda x: x['seeders'], reverse=reverse)
-    elif sort_by == 'name':
-        return sorted(torrents, key=lambda x: x['name'].lower(), reverse=reverse)
-    elif sort_by == 'size':
-        # Parse size for sorting (convert to MB)
-        def size_to_mb(size_str):
-            import re
-            match = re.search(r'([\d.]+)\s*(GB|MB|TB)', size_str, re.I)
-            if not match:
-                return 0
-            value = float(match.group(1))
-            unit = match.group(2).upper()
-            if unit == 'GB':
-                return value * 1024
-            elif unit == 'TB':
-                return value * 1024 * 1024
-            return value
-
-        return sorted(torrents, key=lambda x: size_to_mb(x['size']), reverse=reverse)
-
-    return torrents
+    # Normalized once so the unsorted and top-K paths agree
+    if limit is not None and limit <= 0:
+        limit = None
+
+    key = SORT_KEYS.get(sort_by)
+    if key is None and sort_by in DERIVED_SORT_KEYS:
+        key = DERIVED_SORT_KEYS[sort_by](torrents_cache)
+    if key is None:
+        return torrents[:limit] if limit is not None else torrents
+
+    if limit is not None and limit < len(torrents):
+        # O(N log K) top-K selection; same (stable) result as sorted()[:limit]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(limit, torrents, key=key)
+
+    return sorted(torrents, key=key, reverse=reverse)
 
 
 @app.route('/')
 def index():
-    """Main page"""
-    return render_template('index.html', categories=CATEGORIES)
+    """
+    Main page
+
+    The template only depends on static data, so it is rendered on the first
+    visit and the HTML reused afterwards (re-rendered each time in debug mode
+    so template edits show up).
+    """
+    global _index_html
+
+    if _index_html is None or app.debug:
+        _index_html = render_template('index.html', categories=CATEGORIES)
+
+    response = app.make_response(_index_html)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
 
 
 @app.route('/api/torrents')
+@cached_response(timeout=30, unless=lambda: request.args.get('mode', 'full') != 'cache-only')
 def api_torrents():
     """
     API endpoint to fetch torrents with mode-based caching
@@ -548,9 +1315,14 @@ def api_torrents():
         - mode: Fetch mode ('cache-only', 'incremental', 'full') - default: 'full'
         - categories: Comma-separated category names
         - days: Number of days back (for 'full' mode only) - default: user's setting or DEFAULT_TIME_WINDOW_DAYS
+        - sort: Optional server-side sort field (snatched, date, size, seeders, name)
+        - order: Sort order for 'sort' (asc or desc) - default: desc
+        - limit: Only return the top N torrents of the sorted result
+        - max_days: Only return torrents added in the last N days
+        - min_snatched, exclude, search: Optional server-side filters (see filter_torrents)
 
     NOTE: Filtering and sorting have been moved to client-side for better performance.
-          This endpoint returns the full dataset (unfiltered).
+          This endpoint returns the full dataset (unfiltered) unless filter or sort parameters are given.
     """
     # Parse mode
     mode = request.args.get('mode', 'full')
@@ -571,23 +1343,50 @@ def api_torrents():
     # Fetch torrents with new mode-based caching
     torrents, metadata = refresh_torrents(mode=mode, categories=categories, days=days)
 
-    # Filter by categories (only if specified and different from defaults)
+    # The response only depends on the cache state and the query, so a poll
+    # with a matching If-None-Match is answered before filtering and encoding
+    updated_at = torrents_cache.get('metadata', {}).get('updated_at')
+    etag = hashlib.blake2b(
+        f"{updated_at}|{metadata!r}|{request.full_path}".encode(), digest_size=8
+    ).hexdigest()
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    # Optional server-side filters; the category and max_days filters are
+    # answered from the cache indexes (see filter_torrents)
+    filters = {key: request.args.get(key) for key in ('min_snatched', 'exclude', 'search') if request.args.get(key)}
     if categories:
-        torrents = [t for t in torrents if t['category'] in categories]
-
-    # Convert datetime objects to strings for JSON
-    result = []
-    for torrent in torrents:
-        t = torrent.copy()
-        if 'timestamp' in t:
-            t['timestamp'] = t['timestamp'].isoformat()
-        result.append(t)
-
-    return jsonify({
-        'torrents': result,  # Full dataset (unfiltered by other parameters)
+        filters['categories'] = categories
+    if request.args.get('max_days'):
+        filters['days'] = request.args.get('max_days')
+    if filters:
+        torrents = filter_torrents(torrents, filters)
+
+    # Optional server-side sort / top-K
+    sort_by = request.args.get('sort')
+    if sort_by:
+        limit = None
+        if request.args.get('limit'):
+            try:
+                limit = int(request.args.get('limit'))
+            except ValueError:
+                limit = None
+        order = request.args.get('order', 'desc')
+        torrents = sort_torrents(torrents, sort_by=sort_by, order=order, limit=limit)
+
+    # Torrents are JSON-native (epoch timestamps), no copies needed
+    response = jsonify({
+        'torrents': torrents,  # Full dataset (unfiltered by other parameters)
         'metadata': metadata,  # Cache metadata
-        'count': len(result)  # For backward compatibility
+        'count': len(torrents)  # For backward compatibility
     })
+    response.set_etag(etag)
+    # Browsers may keep the body but must revalidate before reusing it
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
 
 @app.route('/api/refresh')
@@ -629,10 +1428,12 @@ def api_refresh():
 
 
 @app.route('/api/stats')
+@cached_response(timeout=30, cache_control='private, no-cache')
 def api_stats():
     """Get statistics about cached torrents"""
-    torrents = torrents_cache['data']
-    metadata = torrents_cache.get('metadata', {})
+    cache = torrents_cache  # one consistent state for the whole request
+    torrents = cache['data']
+    metadata = cache.get('metadata', {})
 
     if not torrents:
         return jsonify({
@@ -642,15 +1443,7 @@ def api_stats():
         })
 
     # Get cache age
-    cache_age = None
-    updated_at = metadata.get('updated_at')
-    if updated_at:
-        age_seconds = (datetime.now() - updated_at).total_seconds()
-        age_minutes = int(age_seconds / 60)
-        if age_minutes < 60:
-            cache_age = f"{age_minutes} minutes ago"
-        else:
-            cache_age = f"{int(age_minutes / 60)} hours ago"
+    cache_age = _get_cache_age()
 
     # Get category stats from metadata
     categories_count = {}
@@ -749,8 +1542,9 @@ def api_cookie_set():
                 'error': 'Invalid cookie format. Expected: uid=...; pass=...'
             }), 400
 
-        # Save cookie
+        # Save cookie (and drop masks of previous cookie values)
         config_manager.set_cookie(new_cookie)
+        mask_cookie.cache_clear()
 
         # Hot reload scraper
         global scraper_instance
@@ -808,9 +1602,11 @@ def api_cookie_test():
 def api_cookie_browsers():
     """Detect available browsers"""
     try:
-        from browser_cookie_extractor import BrowserCookieExtractor
+        from browser_cookie_extractor import get_extractor
 
-        extractor = BrowserCookieExtractor()
+        extractor = get_extractor()
+        if request.args.get('refresh') == '1':
+            extractor.refresh()
         browsers = extractor.detect_browsers()
 
         return jsonify({
@@ -825,13 +1621,13 @@ def api_cookie_browsers():
 def api_cookie_extract():
     """Extract cookie from browser"""
     try:
-        from browser_cookie_extractor import BrowserCookieExtractor
+        from browser_cookie_extractor import get_extractor
 
         data = request.get_json()
         browser = data.get('browser', 'chrome').lower()
         profile = data.get('profile', 'Default')
 
-        extractor = BrowserCookieExtractor()
+        extractor = get_extractor()
 
         # Extract based on browser type
         if browser == 'chrome':
@@ -842,6 +1638,8 @@ def api_cookie_extract():
             result = extractor.extract_from_brave(profile)
         elif browser == 'firefox':
             result = extractor.extract_from_firefox(profile)
+        elif browser == 'any':
+            result = extractor.extract_from_any()
         else:
             return jsonify({'error': f'Unsupported browser: {browser}'}), 400
 
@@ -916,6 +1714,7 @@ def api_user_info():
 # ============================================================================
 
 @app.route('/api/qbittorrent/status')
+@cached_response(timeout=15)
 def api_qbittorrent_status():
     """Get qBittorrent integration status"""
     try:
@@ -936,12 +1735,8 @@ def api_qbittorrent_config_get():
     try:
         config = config_manager.get_qbittorrent_config()
 
-        # Mask password for security
-        masked_config = config.copy()
-        if config.get('password'):
-            masked_config['password'] = '***'
-
-        return jsonify(masked_config)
+        # Mask password for security (copy is built in a single pass)
+        return jsonify({**config, 'password': '***' if config.get('password') else ''})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -979,6 +1774,7 @@ def api_qbittorrent_config_set():
             category=category,
             use_category=use_category
         )
+        invalidate_response_cache()
 
         return jsonify({
             'success': True,
@@ -1011,6 +1807,8 @@ def api_qbittorrent_test():
 @app.route('/api/qbittorrent/add', methods=['POST'])
 def api_qbittorrent_add():
     """Add torrent to qBittorrent"""
+    from qbittorrent_client import AuthenticationError, ConnectionError, TorrentAddError
+
     try:
         data = request.get_json()
 
@@ -1108,22 +1906,9 @@ def api_igdb_search():
         game_name = data.get('game_name')
         platform = data.get('platform')  # Optional
 
-        # Map platform names to IGDB platform IDs
-        platform_map = {
-            'PC': '6',
-            'Nintendo Switch': '130',
-            'Nintendo 3DS': '37',
-            'Wii': '5',
-            'Wii U': '41',
-            'PlayStation 3': '9',
-            'PlayStation 4': '48',
-            'PlayStation 5': '167',
-            'Xbox 360': '12',
-            'Xbox One': '49',
-            'Xbox Series': '169'
-        }
-
-        platform_id = platform_map.get(platform) if platform else None
+        # Map platform names to IGDB platform IDs (shared module-level table)
+        from igdb_client import IGDB_PLATFORMS
+        platform_id = IGDB_PLATFORMS.get(platform) if platform else None
 
         # Get IGDB client and search
         client = get_igdb_client()
@@ -1150,6 +1935,7 @@ def api_igdb_search():
 
 
 @app.route('/api/igdb/status')
+@cached_response(timeout=15)
 def api_igdb_status():
     """
     Check if IGDB is configured and working
@@ -1217,6 +2003,7 @@ def api_igdb_test():
     try:
         client = get_igdb_client()
         result = client.test_connection()
+        invalidate_response_cache()  # Token status may have changed
         return jsonify(result)
 
     except Exception as e:
@@ -1238,6 +2025,8 @@ def igdb_manager():
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
     print("=" * 60)
     print("IPTorrents Browser")
     print("=" * 60)
@@ -1258,4 +2047,11 @@ if __name__ == '__main__':
     print("Cookie Manager: http://localhost:5000/cookie-manager")
     print("Press Ctrl+C to stop\n")
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debug mode (reloader + debugger) only when asked for; for production
+    # serve wsgi.py with a WSGI server instead of the development server
+    app.run(
+        debug=os.getenv('FLASK_DEBUG') == '1',
+        host='0.0.0.0',
+        port=5000,
+        threaded=True
+    )
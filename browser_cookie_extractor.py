@@ -4,21 +4,26 @@ Extracts IPTorrents cookies from local browser databases
 Supports: Chrome, Edge, Firefox, Brave
 """
 
+import ctypes
 import os
+import pathlib
 import sqlite3
 import shutil
 import tempfile
 import json
+import logging
 import base64
+import configparser
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-# Windows DPAPI for Chrome/Edge cookie decryption
-try:
-    import win32crypt
-    DPAPI_AVAILABLE = True
-except ImportError:
-    DPAPI_AVAILABLE = False
-    print("Warning: win32crypt not available. Chrome/Edge extraction will not work.")
+logger = logging.getLogger(__name__)
+
+# Windows DPAPI for Chrome/Edge cookie decryption - imported on first use
+# (see _get_dpapi) so Firefox-only users and non-Windows systems never load
+# pywin32. None = not tried yet, False = not installed.
+_win32crypt = None
 
 # AES encryption for newer Chrome versions (80+)
 try:
@@ -26,16 +31,103 @@ try:
     AES_AVAILABLE = True
 except ImportError:
     AES_AVAILABLE = False
-    print("Warning: PyCryptodome not available. Modern Chrome/Edge extraction may not work.")
+    logger.warning("PyCryptodome not available. Modern Chrome/Edge extraction may not work.")
+
+
+def _get_dpapi():
+    """
+    Import win32crypt on first use
+
+    Returns:
+        module: win32crypt
+
+    Raises:
+        ImportError: If pywin32 is not installed
+    """
+    global _win32crypt
+    if _win32crypt is None:
+        try:
+            import win32crypt
+            _win32crypt = win32crypt
+        except ImportError:
+            _win32crypt = False
+    if _win32crypt is False:
+        raise ImportError("win32crypt library not available. Install pywin32.")
+    return _win32crypt
+
+
+def _fast_snapshot(src, dst):
+    """
+    Snapshot a file for reading as cheaply as the filesystem allows
+
+    Tries a hardlink first (no bytes copied; safe since the result is only
+    opened with mode=ro), then the Windows CopyFile2 API, and finally
+    shutil.copy2.
+
+    Args:
+        src: File to snapshot
+        dst: Destination path (must not exist)
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    kernel32 = getattr(ctypes, 'windll', None) and ctypes.windll.kernel32
+    if kernel32 is not None and hasattr(kernel32, 'CopyFile2'):
+        # CopyFile2 returns an HRESULT; 0 is S_OK
+        if kernel32.CopyFile2(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), None) == 0:
+            return
+
+    shutil.copy2(src, dst)
 
 
 class BrowserCookieExtractor:
     """Extract IPTorrents cookies from local browser databases"""
 
-    def __init__(self):
+    # Chromium-based browsers: id -> (display name, directories under LOCALAPPDATA)
+    _CHROMIUM_BROWSERS = {
+        'chrome': ('Chrome', ('Google', 'Chrome')),
+        'edge': ('Edge', ('Microsoft', 'Edge')),
+        'brave': ('Brave', ('BraveSoftware', 'Brave-Browser')),
+    }
+
+    # Cookie lookups, bound with _query_args: three host spellings, then
+    # one placeholder per required cookie ({names} is filled in __init__).
+    # Exact host matches use the host_key/host index, unlike
+    # LIKE '%domain%' which scans every row.
+    _SQL_CHROMIUM = (
+        'SELECT name, encrypted_value FROM cookies '
+        'WHERE host_key IN (?, ?, ?) AND name IN ({names})'
+    )
+    _SQL_FIREFOX = (
+        'SELECT name, value FROM moz_cookies '
+        'WHERE host IN (?, ?, ?) AND name IN ({names})'
+    )
+
+    def __init__(self, required_cookies=None):
+        """
+        Initialize the extractor
+
+        Args:
+            required_cookies: Cookie names that must all be found
+                (default: ['uid', 'pass'])
+        """
         self.domain = 'iptorrents.com'
-        self.required_cookies = ['uid', 'pass']
+        self.required_cookies = list(required_cookies or ['uid', 'pass'])
+        self._required_set = frozenset(self.required_cookies)
+        # Queries with one name placeholder per required cookie, built once
+        names = ', '.join('?' * len(self.required_cookies))
+        self._sql_chromium = self._SQL_CHROMIUM.format(names=names)
+        self._sql_firefox = self._SQL_FIREFOX.format(names=names)
+        # Bind parameters for those queries: the host spellings browsers
+        # store for the domain, then the required cookie names
+        self._query_args = (self.domain, f'.{self.domain}', f'www.{self.domain}',
+                            *self.required_cookies)
         self._encryption_key_cache = {}
+        self._browser_cache = None
+        self._firefox_ini_profiles = None
 
     def _get_encryption_key(self, browser_path):
         """
@@ -67,13 +159,12 @@ class BrowserCookieExtractor:
             encrypted_key = encrypted_key[5:]
 
             # Decrypt using DPAPI
-            if DPAPI_AVAILABLE:
-                key = win32crypt.CryptUnprotectData(encrypted_key, None, None, None, 0)[1]
-                self._encryption_key_cache[browser_path] = key
-                return key
+            key = _get_dpapi().CryptUnprotectData(encrypted_key, None, None, None, 0)[1]
+            self._encryption_key_cache[browser_path] = key
+            return key
 
         except Exception as e:
-            print(f"Error getting encryption key: {e}")
+            logger.warning("Error getting encryption key: %s", e)
 
         return None
 
@@ -92,7 +183,8 @@ class BrowserCookieExtractor:
             return ""
 
         # Check if it's AES encrypted (starts with 'v10', 'v11', or 'v20')
-        if encrypted_value[:3] in (b'v10', b'v11', b'v20'):
+        prefix = encrypted_value[:3]
+        if prefix in (b'v10', b'v11', b'v20'):
             if not AES_AVAILABLE or not encryption_key:
                 raise Exception("AES decryption not available. Install pycryptodome: pip install pycryptodome")
 
@@ -108,12 +200,14 @@ class BrowserCookieExtractor:
             # Create AES-GCM cipher
             cipher = AES.new(encryption_key, AES.MODE_GCM, nonce=nonce)
 
-            # Decrypt and verify
+            # Decrypt, then verify the tag on the same cipher object so the
+            # unverified fallback below doesn't need a second key setup
+            decrypted = cipher.decrypt(ciphertext)
             try:
-                decrypted = cipher.decrypt_and_verify(ciphertext, tag)
-            except ValueError as e:
+                cipher.verify(tag)
+            except ValueError:
                 # v20 might use app-bound encryption
-                if encrypted_value[:3] == b'v20':
+                if prefix == b'v20':
                     raise Exception(
                         "This browser uses app-bound encryption (v20) which cannot be decrypted by external tools. "
                         "Please manually copy your cookie from the browser:\n"
@@ -122,56 +216,42 @@ class BrowserCookieExtractor:
                         "3. Find iptorrents.com cookies (uid and pass)\n"
                         "4. Copy the values and format as: uid=VALUE; pass=VALUE"
                     )
-                # For v10/v11, try without verification
-                cipher = AES.new(encryption_key, AES.MODE_GCM, nonce=nonce)
-                decrypted = cipher.decrypt(ciphertext)
+                # For v10/v11, use the plaintext without verification
 
             return decrypted.decode('utf-8')
         else:
             # Old DPAPI encryption
-            if not DPAPI_AVAILABLE:
+            try:
+                dpapi = _get_dpapi()
+            except ImportError:
                 raise Exception("DPAPI decryption not available. Install pywin32.")
 
-            return win32crypt.CryptUnprotectData(encrypted_value, None, None, None, 0)[1].decode('utf-8')
+            return dpapi.CryptUnprotectData(encrypted_value, None, None, None, 0)[1].decode('utf-8')
 
     def detect_browsers(self):
         """
         Detect which browsers are installed and have cookie databases
 
+        The result is cached on the instance; call refresh() to rescan.
+
         Returns:
             list: List of available browser dicts
         """
+        if self._browser_cache is not None:
+            return self._browser_cache
+
         browsers = []
 
-        # Chrome
-        chrome_path = self._get_chrome_cookie_path()
-        if chrome_path and os.path.exists(chrome_path):
-            browsers.append({
-                'name': 'Chrome',
-                'id': 'chrome',
-                'path': chrome_path,
-                'available': True
-            })
-
-        # Edge
-        edge_path = self._get_edge_cookie_path()
-        if edge_path and os.path.exists(edge_path):
-            browsers.append({
-                'name': 'Edge',
-                'id': 'edge',
-                'path': edge_path,
-                'available': True
-            })
-
-        # Brave
-        brave_path = self._get_brave_cookie_path()
-        if brave_path and os.path.exists(brave_path):
-            browsers.append({
-                'name': 'Brave',
-                'id': 'brave',
-                'path': brave_path,
-                'available': True
-            })
+        # Chromium browsers - one entry per profile
+        for browser_id, (name, vendor_dirs) in self._CHROMIUM_BROWSERS.items():
+            for profile_name, cookie_path in self._get_chromium_cookie_paths(*vendor_dirs):
+                browsers.append({
+                    'name': name if profile_name == 'Default' else f'{name} ({profile_name})',
+                    'id': browser_id,
+                    'path': cookie_path,
+                    'profile': profile_name,
+                    'available': True
+                })
 
         # Firefox
         firefox_paths = self._get_firefox_cookie_paths()
@@ -185,8 +265,14 @@ class BrowserCookieExtractor:
                     'available': True
                 })
 
+        self._browser_cache = browsers
         return browsers
 
+    def refresh(self):
+        """Forget detected browsers so the next detect_browsers() rescans the disk"""
+        self._browser_cache = None
+        self._firefox_ini_profiles = None
+
     def extract_from_chrome(self, profile='Default'):
         """
         Extract cookies from Chrome
@@ -197,27 +283,7 @@ class BrowserCookieExtractor:
         Returns:
             dict: {success, cookie, browser, profile, error}
         """
-        if not DPAPI_AVAILABLE:
-            return {
-                'success': False,
-                'cookie': None,
-                'browser': 'Chrome',
-                'profile': profile,
-                'error': 'win32crypt library not available. Install pywin32.'
-            }
-
-        cookie_path = self._get_chrome_cookie_path(profile)
-
-        if not cookie_path or not os.path.exists(cookie_path):
-            return {
-                'success': False,
-                'cookie': None,
-                'browser': 'Chrome',
-                'profile': profile,
-                'error': f'Chrome cookie database not found at {cookie_path}'
-            }
-
-        return self._extract_chromium_cookies(cookie_path, 'Chrome', profile)
+        return self._extract_chromium('chrome', profile)
 
     def extract_from_edge(self, profile='Default'):
         """
@@ -229,27 +295,7 @@ class BrowserCookieExtractor:
         Returns:
             dict: {success, cookie, browser, profile, error}
         """
-        if not DPAPI_AVAILABLE:
-            return {
-                'success': False,
-                'cookie': None,
-                'browser': 'Edge',
-                'profile': profile,
-                'error': 'win32crypt library not available. Install pywin32.'
-            }
-
-        cookie_path = self._get_edge_cookie_path(profile)
-
-        if not cookie_path or not os.path.exists(cookie_path):
-            return {
-                'success': False,
-                'cookie': None,
-                'browser': 'Edge',
-                'profile': profile,
-                'error': f'Edge cookie database not found at {cookie_path}'
-            }
-
-        return self._extract_chromium_cookies(cookie_path, 'Edge', profile)
+        return self._extract_chromium('edge', profile)
 
     def extract_from_brave(self, profile='Default'):
         """
@@ -261,27 +307,82 @@ class BrowserCookieExtractor:
         Returns:
             dict: {success, cookie, browser, profile, error}
         """
-        if not DPAPI_AVAILABLE:
+        return self._extract_chromium('brave', profile)
+
+    def extract_from_any(self):
+        """
+        Extract cookies from whichever browser has them
+
+        Every supported browser is tried at once on a small thread pool (the
+        work is disk reads and DPAPI calls, which release the GIL); the first
+        successful result wins and lookups that have not started are cancelled.
+
+        Returns:
+            dict: {success, cookie, browser, profile, error}
+        """
+        extractors = [self.extract_from_chrome, self.extract_from_edge,
+                      self.extract_from_brave, self.extract_from_firefox]
+
+        executor = ThreadPoolExecutor(max_workers=len(extractors))
+        try:
+            futures = [executor.submit(extract) for extract in extractors]
+            errors = []
+            for future in as_completed(futures):
+                result = future.result()
+                if result['success']:
+                    for other in futures:
+                        other.cancel()
+                    return result
+                errors.append(f"{result['browser']}: {result['error']}")
+        finally:
+            # Don't wait for slower browsers once we have an answer
+            executor.shutdown(wait=False)
+
+        return {
+            'success': False,
+            'cookie': None,
+            'browser': None,
+            'profile': None,
+            'error': 'No browser had IPTorrents cookies. ' + ' | '.join(errors)
+        }
+
+    def _extract_chromium(self, browser_id, profile):
+        """
+        Locate and extract cookies for one of _CHROMIUM_BROWSERS
+
+        Args:
+            browser_id: Key into _CHROMIUM_BROWSERS ('chrome', 'edge', 'brave')
+            profile: Profile name
+
+        Returns:
+            dict: {success, cookie, browser, profile, error}
+        """
+        browser_name, vendor_dirs = self._CHROMIUM_BROWSERS[browser_id]
+
+        try:
+            _get_dpapi()
+        except ImportError as e:
             return {
                 'success': False,
                 'cookie': None,
-                'browser': 'Brave',
+                'browser': browser_name,
                 'profile': profile,
-                'error': 'win32crypt library not available. Install pywin32.'
+                'error': str(e)
             }
 
-        cookie_path = self._get_brave_cookie_path(profile)
+        # Already checked for existence by _get_chromium_cookie_path
+        cookie_path = self._get_chromium_cookie_path(vendor_dirs, profile)
 
-        if not cookie_path or not os.path.exists(cookie_path):
+        if not cookie_path:
             return {
                 'success': False,
                 'cookie': None,
-                'browser': 'Brave',
+                'browser': browser_name,
                 'profile': profile,
-                'error': f'Brave cookie database not found at {cookie_path}'
+                'error': f'{browser_name} cookie database not found for profile "{profile}"'
             }
 
-        return self._extract_chromium_cookies(cookie_path, 'Brave', profile)
+        return self._extract_chromium_cookies(cookie_path, browser_name, profile)
 
     def extract_from_firefox(self, profile=None):
         """
@@ -293,6 +394,20 @@ class BrowserCookieExtractor:
         Returns:
             dict: {success, cookie, browser, profile, error}
         """
+        # Reuse the path found by an earlier detect_browsers() instead of
+        # listing every profile directory again
+        if profile and self._browser_cache:
+            for browser in self._browser_cache:
+                if (browser['id'] == 'firefox' and browser['profile'] == profile
+                        and os.path.exists(browser['path'])):
+                    return self._extract_firefox_cookies(browser['path'], profile)
+
+        # Otherwise look the profile up in profiles.ini before scanning
+        if profile:
+            cookie_path = self._firefox_profile_from_ini(profile)
+            if cookie_path:
+                return self._extract_firefox_cookies(cookie_path, profile)
+
         firefox_paths = self._get_firefox_cookie_paths()
 
         if not firefox_paths:
@@ -336,43 +451,22 @@ class BrowserCookieExtractor:
         # Get encryption key for AES decryption
         encryption_key = self._get_encryption_key(user_data_path)
 
-        # Copy database to temp file (browser might have it locked)
-        temp_dir = tempfile.gettempdir()
-        temp_cookie_path = os.path.join(temp_dir, f'cookies_{browser_name.lower()}.sqlite')
-
         try:
-            shutil.copy2(cookie_path, temp_cookie_path)
+            conn, temp_dir = self._open_cookie_db(cookie_path)
         except Exception as e:
             return {
                 'success': False,
                 'cookie': None,
                 'browser': browser_name,
                 'profile': profile,
-                'error': f'Could not copy cookie database: {str(e)}. Close {browser_name} and try again.'
+                'error': f'Could not open cookie database: {str(e)}. Close {browser_name} and try again.'
             }
 
         try:
-            # Connect to database
-            conn = sqlite3.connect(temp_cookie_path)
-            cursor = conn.cursor()
-
             # Query for IPTorrents cookies
-            query = """
-                SELECT name, encrypted_value, expires_utc
-                FROM cookies
-                WHERE host_key LIKE ?
-            """
-
-            cursor.execute(query, (f'%{self.domain}%',))
-            rows = cursor.fetchall()
-
-            conn.close()
+            rows = conn.execute(self._sql_chromium, self._query_args).fetchall()
 
             if not rows:
-                # Clean up temp file
-                if os.path.exists(temp_cookie_path):
-                    os.remove(temp_cookie_path)
-
                 return {
                     'success': False,
                     'cookie': None,
@@ -381,34 +475,36 @@ class BrowserCookieExtractor:
                     'error': f'No cookies found for {self.domain}. Make sure you are logged into IPTorrents in {browser_name}.'
                 }
 
-            # Extract and decrypt cookies
+            # Extract and decrypt cookies - the same name can be stored under
+            # several host spellings, so decrypt each name once and stop as
+            # soon as every required cookie is in hand
             cookies = {}
-            for name, encrypted_value, expires_utc in rows:
-                if name in self.required_cookies:
-                    try:
-                        # Decrypt using new method (handles both AES and DPAPI)
-                        decrypted_value = self._decrypt_cookie_value(encrypted_value, encryption_key)
-                        cookies[name] = decrypted_value
-                    except Exception as e:
-                        print(f"Error decrypting {name} cookie: {e}")
-
-            # Clean up temp file
-            if os.path.exists(temp_cookie_path):
-                os.remove(temp_cookie_path)
+            remaining = set(self._required_set)
+            for name, encrypted_value in rows:
+                if name not in remaining:
+                    continue
+                try:
+                    # Decrypt using new method (handles both AES and DPAPI)
+                    cookies[name] = self._decrypt_cookie_value(encrypted_value, encryption_key)
+                except Exception as e:
+                    logger.warning("Error decrypting %s cookie: %s", name, e)
+                    continue
+                remaining.discard(name)
+                if not remaining:
+                    break
 
             # Check if we got all required cookies
-            missing = [c for c in self.required_cookies if c not in cookies]
-            if missing:
+            if remaining:
                 return {
                     'success': False,
                     'cookie': None,
                     'browser': browser_name,
                     'profile': profile,
-                    'error': f'Missing required cookies: {", ".join(missing)}'
+                    'error': f'Missing required cookies: {", ".join(sorted(remaining))}'
                 }
 
             # Format cookie string
-            cookie_string = '; '.join([f'{name}={value}' for name, value in cookies.items()])
+            cookie_string = '; '.join(f'{name}={value}' for name, value in cookies.items())
 
             return {
                 'success': True,
@@ -419,10 +515,6 @@ class BrowserCookieExtractor:
             }
 
         except Exception as e:
-            # Clean up temp file
-            if os.path.exists(temp_cookie_path):
-                os.remove(temp_cookie_path)
-
             return {
                 'success': False,
                 'cookie': None,
@@ -431,6 +523,11 @@ class BrowserCookieExtractor:
                 'error': f'Error extracting cookies: {str(e)}'
             }
 
+        finally:
+            conn.close()
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
     def _extract_firefox_cookies(self, cookie_path, profile_name):
         """
         Extract cookies from Firefox
@@ -442,43 +539,22 @@ class BrowserCookieExtractor:
         Returns:
             dict: Result dictionary
         """
-        # Copy database to temp file (browser might have it locked)
-        temp_dir = tempfile.gettempdir()
-        temp_cookie_path = os.path.join(temp_dir, 'cookies_firefox.sqlite')
-
         try:
-            shutil.copy2(cookie_path, temp_cookie_path)
+            conn, temp_dir = self._open_cookie_db(cookie_path)
         except Exception as e:
             return {
                 'success': False,
                 'cookie': None,
                 'browser': 'Firefox',
                 'profile': profile_name,
-                'error': f'Could not copy cookie database: {str(e)}. Close Firefox and try again.'
+                'error': f'Could not open cookie database: {str(e)}. Close Firefox and try again.'
             }
 
         try:
-            # Connect to database
-            conn = sqlite3.connect(temp_cookie_path)
-            cursor = conn.cursor()
-
             # Query for IPTorrents cookies
-            query = """
-                SELECT name, value, expiry
-                FROM moz_cookies
-                WHERE host LIKE ?
-            """
-
-            cursor.execute(query, (f'%{self.domain}%',))
-            rows = cursor.fetchall()
-
-            conn.close()
+            rows = conn.execute(self._sql_firefox, self._query_args).fetchall()
 
             if not rows:
-                # Clean up temp file
-                if os.path.exists(temp_cookie_path):
-                    os.remove(temp_cookie_path)
-
                 return {
                     'success': False,
                     'cookie': None,
@@ -489,27 +565,26 @@ class BrowserCookieExtractor:
 
             # Extract cookies (Firefox cookies are NOT encrypted)
             cookies = {}
-            for name, value, expiry in rows:
-                if name in self.required_cookies:
+            remaining = set(self._required_set)
+            for name, value in rows:
+                if name in remaining:
                     cookies[name] = value
-
-            # Clean up temp file
-            if os.path.exists(temp_cookie_path):
-                os.remove(temp_cookie_path)
+                    remaining.discard(name)
+                    if not remaining:
+                        break
 
             # Check if we got all required cookies
-            missing = [c for c in self.required_cookies if c not in cookies]
-            if missing:
+            if remaining:
                 return {
                     'success': False,
                     'cookie': None,
                     'browser': 'Firefox',
                     'profile': profile_name,
-                    'error': f'Missing required cookies: {", ".join(missing)}'
+                    'error': f'Missing required cookies: {", ".join(sorted(remaining))}'
                 }
 
             # Format cookie string
-            cookie_string = '; '.join([f'{name}={value}' for name, value in cookies.items()])
+            cookie_string = '; '.join(f'{name}={value}' for name, value in cookies.items())
 
             return {
                 'success': True,
@@ -520,10 +595,6 @@ class BrowserCookieExtractor:
             }
 
         except Exception as e:
-            # Clean up temp file
-            if os.path.exists(temp_cookie_path):
-                os.remove(temp_cookie_path)
-
             return {
                 'success': False,
                 'cookie': None,
@@ -532,50 +603,186 @@ class BrowserCookieExtractor:
                 'error': f'Error extracting cookies: {str(e)}'
             }
 
-    def _get_chrome_cookie_path(self, profile='Default'):
-        """Get Chrome cookie database path"""
-        local_app_data = os.getenv('LOCALAPPDATA')
-        if not local_app_data:
-            return None
+        finally:
+            conn.close()
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
-        # Try new location first (Chrome 96+)
-        cookie_path = os.path.join(local_app_data, 'Google', 'Chrome', 'User Data', profile, 'Network', 'Cookies')
-        if os.path.exists(cookie_path):
-            return cookie_path
+    def _open_cookie_db(self, cookie_path):
+        """
+        Open a browser cookie database for reading
 
-        # Fall back to old location
-        cookie_path = os.path.join(local_app_data, 'Google', 'Chrome', 'User Data', profile, 'Cookies')
-        return cookie_path if os.path.exists(cookie_path) else None
+        The live database is opened read-only in place, retrying with
+        immutable=1 (which skips SQLite's locking) if the browser holds a lock.
+        immutable=1 also ignores the WAL, so a database with a non-empty -wal
+        file is never opened that way: it and its -wal/-shm sidecars are
+        copied to a temp directory and the copy is opened instead. The copy
+        is also the last resort when the live file can't be opened at all.
+
+        Args:
+            cookie_path: Path to cookie database
+
+        Returns:
+            tuple: (connection, temp_dir) - temp_dir is None unless a copy was made
+        """
+        try:
+            has_wal = os.path.getsize(cookie_path + '-wal') > 0
+        except OSError:
+            has_wal = False
+
+        if not has_wal:
+            live_uri = pathlib.Path(os.path.abspath(cookie_path)).as_uri()
+            for params in ('?mode=ro', '?mode=ro&immutable=1'):
+                try:
+                    conn = sqlite3.connect(live_uri + params, uri=True, isolation_level=None)
+                    try:
+                        # Read the header now so an unreadable file fails here, not mid-query
+                        conn.execute('PRAGMA schema_version')
+                    except sqlite3.Error:
+                        conn.close()
+                        raise
+                    return self._configure_reader(conn), None
+                except sqlite3.OperationalError:
+                    pass
+
+        temp_dir = tempfile.mkdtemp(prefix='iptbrowser_cookies_')
+        try:
+            temp_cookie_path = os.path.join(temp_dir, os.path.basename(cookie_path))
+            _fast_snapshot(cookie_path, temp_cookie_path)
+            # The sidecars are always real copies: the snapshot may be a
+            # hardlink to the live database, and a checkpoint of a shared WAL
+            # would write into the browser's file
+            for suffix in ('-wal', '-shm'):
+                with contextlib.suppress(FileNotFoundError):
+                    shutil.copy2(cookie_path + suffix, temp_cookie_path + suffix)
+            temp_uri = pathlib.Path(temp_cookie_path).as_uri() + '?mode=ro'
+            return self._configure_reader(sqlite3.connect(temp_uri, uri=True, isolation_level=None)), temp_dir
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def _configure_reader(conn):
+        """
+        Apply read-only pragmas to a cookie database connection
+
+        query_only keeps SQLite from creating a journal (or checkpointing a
+        copied WAL) since we never write, and mmap_size lets it map pages
+        directly instead of copying them through read() calls. The page
+        cache is capped at 2 MB since a lookup only touches a few pages.
+
+        Args:
+            conn: Open sqlite3 connection
+
+        Returns:
+            sqlite3.Connection: The same connection
+        """
+        conn.execute('PRAGMA query_only=1')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-2048')
+        return conn
 
-    def _get_edge_cookie_path(self, profile='Default'):
-        """Get Edge cookie database path"""
+    def _get_chromium_cookie_path(self, vendor_dirs, profile='Default'):
+        """
+        Get the cookie database path for one Chromium browser profile
+
+        Args:
+            vendor_dirs: Directories under LOCALAPPDATA, e.g. ('Google', 'Chrome')
+            profile: Profile name (default: "Default")
+
+        Returns:
+            str: Cookie database path, or None if not found
+        """
         local_app_data = os.getenv('LOCALAPPDATA')
         if not local_app_data:
             return None
 
-        # Try new location first (Edge 96+)
-        cookie_path = os.path.join(local_app_data, 'Microsoft', 'Edge', 'User Data', profile, 'Network', 'Cookies')
+        profile_dir = os.path.join(local_app_data, *vendor_dirs, 'User Data', profile)
+
+        # Try new location first (Chromium 96+)
+        cookie_path = os.path.join(profile_dir, 'Network', 'Cookies')
         if os.path.exists(cookie_path):
             return cookie_path
 
         # Fall back to old location
-        cookie_path = os.path.join(local_app_data, 'Microsoft', 'Edge', 'User Data', profile, 'Cookies')
+        cookie_path = os.path.join(profile_dir, 'Cookies')
         return cookie_path if os.path.exists(cookie_path) else None
 
-    def _get_brave_cookie_path(self, profile='Default'):
-        """Get Brave cookie database path"""
+    def _get_chromium_cookie_paths(self, *vendor_dirs):
+        """
+        Get cookie database paths for every profile of a Chromium browser
+
+        Args:
+            vendor_dirs: Directories under LOCALAPPDATA, e.g. ('Google', 'Chrome')
+
+        Returns:
+            list: List of (profile_name, cookie_path) tuples, "Default" first
+        """
         local_app_data = os.getenv('LOCALAPPDATA')
         if not local_app_data:
-            return None
+            return []
 
-        # Try new location first (Brave 96+)
-        cookie_path = os.path.join(local_app_data, 'BraveSoftware', 'Brave-Browser', 'User Data', profile, 'Network', 'Cookies')
-        if os.path.exists(cookie_path):
-            return cookie_path
+        user_data = os.path.join(local_app_data, *vendor_dirs, 'User Data')
 
-        # Fall back to old location
-        cookie_path = os.path.join(local_app_data, 'BraveSoftware', 'Brave-Browser', 'User Data', profile, 'Cookies')
-        return cookie_path if os.path.exists(cookie_path) else None
+        profiles = []
+        try:
+            # scandir hands back the entry type with the listing, so only
+            # actual profile directories get stat'ed for a Cookies file
+            with os.scandir(user_data) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False) or entry.name == 'System Profile':
+                        continue
+
+                    # Try new location first (Chromium 96+), then the old one
+                    for cookie_path in (os.path.join(entry.path, 'Network', 'Cookies'),
+                                        os.path.join(entry.path, 'Cookies')):
+                        if os.path.isfile(cookie_path):
+                            profiles.append((entry.name, cookie_path))
+                            break
+        except OSError:
+            return []
+
+        profiles.sort(key=lambda p: (p[0] != 'Default', p[0]))
+        return profiles
+
+    def _firefox_profile_from_ini(self, name):
+        """
+        Find a Firefox profile's cookie database via profiles.ini
+
+        profiles.ini maps profile names to their directories, so a named
+        profile can be opened without scanning the Profiles directory.
+        The file is parsed once per instance.
+
+        Args:
+            name: Firefox profile name (the Name= entry in profiles.ini)
+
+        Returns:
+            str: Cookie database path, or None if not found
+        """
+        if self._firefox_ini_profiles is None:
+            self._firefox_ini_profiles = {}
+
+            app_data = os.getenv('APPDATA')
+            if app_data:
+                firefox_base = os.path.join(app_data, 'Mozilla', 'Firefox')
+                parser = configparser.ConfigParser(interpolation=None)
+                try:
+                    parser.read(os.path.join(firefox_base, 'profiles.ini'), encoding='utf-8')
+                except configparser.Error as e:
+                    logger.warning("Error reading Firefox profiles.ini: %s", e)
+
+                for section in parser.sections():
+                    entry = parser[section]
+                    if 'Name' not in entry or 'Path' not in entry:
+                        continue
+                    profile_dir = os.path.normpath(entry['Path'])
+                    if entry.get('IsRelative', '1') == '1':
+                        profile_dir = os.path.join(firefox_base, profile_dir)
+                    self._firefox_ini_profiles[entry['Name']] = os.path.join(profile_dir, 'cookies.sqlite')
+
+        cookie_path = self._firefox_ini_profiles.get(name)
+        return cookie_path if cookie_path and os.path.isfile(cookie_path) else None
 
     def _get_firefox_cookie_paths(self):
         """
@@ -589,36 +796,61 @@ class BrowserCookieExtractor:
             return []
 
         firefox_dir = os.path.join(app_data, 'Mozilla', 'Firefox', 'Profiles')
-        if not os.path.exists(firefox_dir):
-            return []
 
         profiles = []
         try:
-            for profile_dir in os.listdir(firefox_dir):
-                cookie_path = os.path.join(firefox_dir, profile_dir, 'cookies.sqlite')
-                if os.path.exists(cookie_path):
-                    # Extract profile name (usually format: xxxxx.profile-name)
-                    profile_name = profile_dir.split('.', 1)[1] if '.' in profile_dir else profile_dir
-                    profiles.append((profile_name, cookie_path))
+            # scandir reports entry types from the directory listing itself,
+            # so stray files are skipped without a stat call each
+            with os.scandir(firefox_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    cookie_path = os.path.join(entry.path, 'cookies.sqlite')
+                    if os.path.isfile(cookie_path):
+                        # Extract profile name (usually format: xxxxx.profile-name)
+                        profile_name = entry.name.split('.', 1)[1] if '.' in entry.name else entry.name
+                        profiles.append((profile_name, cookie_path))
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            print(f"Error detecting Firefox profiles: {e}")
+            logger.warning("Error detecting Firefox profiles: %s", e)
 
         return profiles
 
 
+_extractor = None
+
+
+def get_extractor():
+    """
+    Get the shared extractor instance
+
+    Detected browsers and decrypted encryption keys are cached on the
+    instance, so reusing it avoids rescanning profiles on every request.
+
+    Returns:
+        BrowserCookieExtractor: Shared extractor
+    """
+    global _extractor
+    if _extractor is None:
+        _extractor = BrowserCookieExtractor()
+    return _extractor
+
+
 # Convenience function
 def extract_cookie_from_browser(browser='chrome', profile='Default'):
     """
     Quick extraction function
 
     Args:
-        browser: Browser name ('chrome', 'edge', 'brave', 'firefox')
+        browser: Browser name ('chrome', 'edge', 'brave', 'firefox', or 'any')
         profile: Profile name
 
     Returns:
         dict: Result dictionary
     """
-    extractor = BrowserCookieExtractor()
+    extractor = get_extractor()
 
     if browser.lower() == 'chrome':
         return extractor.extract_from_chrome(profile)
@@ -628,6 +860,8 @@ def extract_cookie_from_browser(browser='chrome', profile='Default'):
         return extractor.extract_from_brave(profile)
     elif browser.lower() == 'firefox':
         return extractor.extract_from_firefox(profile)
+    elif browser.lower() == 'any':
+        return extractor.extract_from_any()
     else:
         return {
             'success': False,
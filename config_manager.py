@@ -216,7 +216,11 @@ class ConfigManager:
         if self.config is None:
             self.load_config()
 
-        return self.config.get('qbittorrent', self._create_default_config()['qbittorrent'])
+        # Config is held in memory; only build the defaults when the section is missing
+        qbt_config = self.config.get('qbittorrent')
+        if qbt_config is None:
+            qbt_config = self._create_default_config()['qbittorrent']
+        return qbt_config
 
     def get_qbittorrent_enabled(self):
         """Check if qBittorrent integration is enabled"""
@@ -354,6 +358,25 @@ class ConfigManager:
         return True
 
 
+def parse_cookie_string(cookie_string):
+    """
+    Parse a cookie header string into a dictionary
+
+    Args:
+        cookie_string: String like "uid=123; pass=abc"
+
+    Returns:
+        dict: Cookie name -> value
+    """
+    if not cookie_string:
+        return {}
+
+    return {
+        key.strip(): value.strip()
+        for key, value in (item.split('=', 1) for item in cookie_string.split(';') if '=' in item)
+    }
+
+
 # Convenience function for quick access
 def get_config_manager():
     """Get the singleton ConfigManager instance"""
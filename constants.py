@@ -0,0 +1,20 @@
+"""
+Shared constants for IPT Browser
+Kept free of heavy imports so app.py can load them without pulling in the scraper
+"""
+
+# Category IDs (from IPTorrents URL analysis)
+CATEGORIES = {
+    'PC-ISO': '43',
+    'PC-Rip': '45',
+    'PC-Mixed': '2',
+    'Nintendo': '47',
+    'Playstation': '71',
+    'Xbox': '44',
+    'Wii': '50',
+    'Movie/4K': '101',
+    'Movie/BD-Rip': '90',
+    'Movie/HD/Bluray': '48',
+    'Movie/Web-DL': '20',
+    'Movie/x265': '100'
+}
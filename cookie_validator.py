@@ -7,6 +7,20 @@ import requests
 import re
 from bs4 import BeautifulSoup
 from datetime import datetime
+from config_manager import parse_cookie_string
+
+# Precompiled attribute filters for BeautifulSoup lookups (matched with
+# re.search, so no Python callback per candidate tag)
+LOGIN_ACTION_RE = re.compile('login', re.IGNORECASE)
+USERNAME_INPUT_RE = re.compile('username', re.IGNORECASE)
+STATS_SPAN_CLASS_RE = re.compile('tTipWrap')
+
+# Common expiration messages, matched case-insensitively in a single scan
+# of the page instead of lowercasing a copy and searching once per phrase
+EXPIRATION_RE = re.compile(
+    'session has expired|session expired|please log in|please login|your session|logged out',
+    re.IGNORECASE
+)
 
 
 class CookieValidator:
@@ -47,7 +61,7 @@ class CookieValidator:
             }
 
         # Parse cookie string into dict
-        cookies = self._parse_cookie_string(cookie_string)
+        cookies = parse_cookie_string(cookie_string)
 
         if not cookies:
             return {
@@ -58,13 +72,17 @@ class CookieValidator:
                 'tested_at': datetime.now().isoformat()
             }
 
+        # One session for the probe and the optional redirect follow-up so the
+        # second request reuses the same connection
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.cookies.update(cookies)
+
         try:
             # Make test request to IPTorrents torrent listing page
             # Using a category page is more reliable than base URL
-            response = requests.get(
+            response = session.get(
                 self.test_url,
-                cookies=cookies,
-                headers=self.headers,
                 timeout=15,
                 allow_redirects=False  # Don't follow redirects automatically
             )
@@ -84,10 +102,8 @@ class CookieValidator:
                 else:
                     try:
                         # Follow redirect and check that page
-                        response = requests.get(
+                        response = session.get(
                             self.test_url,
-                            cookies=cookies,
-                            headers=self.headers,
                             timeout=15,
                             allow_redirects=True  # Follow redirects this time
                         )
@@ -167,6 +183,8 @@ class CookieValidator:
                 'expiry_detected': False,
                 'tested_at': datetime.now().isoformat()
             }
+        finally:
+            session.close()
 
     def detect_expiration(self, html_text, soup=None):
         """
@@ -180,29 +198,18 @@ class CookieValidator:
             bool: True if expiration detected
         """
         # Check for common expiration messages
-        expiration_indicators = [
-            'session has expired',
-            'session expired',
-            'please log in',
-            'please login',
-            'your session',
-            'logged out'
-        ]
-
-        html_lower = html_text.lower()
-        for indicator in expiration_indicators:
-            if indicator in html_lower:
-                return True
+        if EXPIRATION_RE.search(html_text):
+            return True
 
         # Check if we're on the login page
         if soup:
             # Look for login form
-            login_form = soup.find('form', {'action': lambda x: x and 'login' in x.lower()})
+            login_form = soup.find('form', {'action': LOGIN_ACTION_RE})
             if login_form:
                 return True
 
             # Look for login input fields
-            username_input = soup.find('input', {'name': lambda x: x and 'username' in x.lower()})
+            username_input = soup.find('input', {'name': USERNAME_INPUT_RE})
             password_input = soup.find('input', {'type': 'password'})
             if username_input and password_input:
                 return True
@@ -240,7 +247,7 @@ class CookieValidator:
                     user_info['username'] = direct_texts[0]
 
             # Try to extract stats from tTipWrap spans
-            stats_spans = soup.find_all('span', {'class': lambda x: x and 'tTipWrap' in str(x)})
+            stats_spans = soup.find_all('span', {'class': STATS_SPAN_CLASS_RE})
 
             for stats_span in stats_spans:
                 try:
@@ -283,28 +290,6 @@ class CookieValidator:
 
         return user_info if user_info.get('username') else None
 
-    def _parse_cookie_string(self, cookie_string):
-        """
-        Parse cookie string into dictionary
-
-        Args:
-            cookie_string: String like "uid=123; pass=abc"
-
-        Returns:
-            dict: Cookie dictionary
-        """
-        cookies = {}
-        try:
-            for item in cookie_string.split('; '):
-                if '=' in item:
-                    key, value = item.split('=', 1)
-                    cookies[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"Error parsing cookie string: {e}")
-            return {}
-
-        return cookies
-
 
 # Convenience function
 def validate_cookie(cookie_string):
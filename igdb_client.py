@@ -44,6 +44,9 @@ class IGDBClient:
         self.access_token = None
         self.token_expiry = None
 
+        # Reused for OAuth and API calls so requests share keep-alive connections
+        self.session = requests.Session()
+
     def _get_access_token(self) -> Optional[str]:
         """
         Get or refresh OAuth access token
@@ -65,7 +68,7 @@ class IGDBClient:
         logger.info("Requesting new IGDB access token from Twitch OAuth")
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.oauth_url,
                 params={
                     'client_id': self.client_id,
@@ -134,7 +137,7 @@ class IGDBClient:
         logger.debug(f"IGDB query: {query}")
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/games',
                 headers=headers,
                 data=query.encode('utf-8'),
@@ -319,6 +322,7 @@ IGDB_PLATFORMS = {
     'PlayStation 5': '167',
     'Xbox One': '49',
     'Xbox Series X|S': '169',
+    'Xbox Series': '169',  # Short name sent by the frontend
     'Nintendo Switch': '130',
     'Wii': '5',
     'Wii U': '41',
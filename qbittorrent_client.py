@@ -6,9 +6,8 @@ Handles authentication, session management, and torrent operations
 import requests
 from datetime import datetime, timedelta
 import logging
+from config_manager import parse_cookie_string
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +48,9 @@ class QbittorrentClient:
         self.config_manager = config_manager
         self.session = requests.Session()
         self.session_expiry_minutes = 60  # Default session timeout
+        # Separate keep-alive session for .torrent downloads from IPTorrents
+        # (keeps the qBittorrent SID cookie jar apart from tracker cookies)
+        self.download_session = requests.Session()
 
     def authenticate(self):
         """
@@ -348,12 +350,7 @@ class QbittorrentClient:
             logger.error("No IPTorrents cookie found in config")
             return None
 
-        # Parse cookie string into dict
-        cookies = {}
-        for item in iptorrents_cookie.split('; '):
-            if '=' in item:
-                key, value = item.split('=', 1)
-                cookies[key] = value
+        cookies = parse_cookie_string(iptorrents_cookie)
 
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -363,7 +360,7 @@ class QbittorrentClient:
             logger.debug(f"Downloading from: {torrent_url}")
             logger.debug(f"Using IPTorrents cookies: {list(cookies.keys())}")
 
-            response = requests.get(
+            response = self.download_session.get(
                 torrent_url,
                 cookies=cookies,
                 headers=headers,
@@ -6,9 +6,12 @@ Scrapes torrent listings from IPTorrents with authentication
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from config_manager import parse_cookie_string
+from constants import CATEGORIES
 import concurrent.futures
 import time
 
@@ -18,20 +21,17 @@ load_dotenv()
 # Base URL
 BASE_URL = "http://www.iptorrents.com"
 
-# Category IDs (from IPTorrents URL analysis)
-CATEGORIES = {
-    'PC-ISO': '43',
-    'PC-Rip': '45',
-    'PC-Mixed': '2',
-    'Nintendo': '47',
-    'Playstation': '71',
-    'Xbox': '44',
-    'Wii': '50',
-    'Movie/4K': '101',
-    'Movie/BD-Rip': '90',
-    'Movie/HD/Bluray': '48',
-    'Movie/Web-DL': '20',
-    'Movie/x265': '100'
+# Only the browse table is parsed; the rest of the page (header, sidebars,
+# scripts) is skipped during tree construction
+TORRENT_TABLE_STRAINER = SoupStrainer('table', id='torrents')
+
+# Seconds per unit for relative upload times ("10.9 hours ago")
+TIME_UNIT_SECONDS = {
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 24 * 60 * 60,
+    'week': 7 * 24 * 60 * 60,
+    'month': 30 * 24 * 60 * 60
 }
 
 
@@ -48,17 +48,20 @@ class IPTorrentsScraper:
         if not cookie_string:
             raise ValueError("Cookie not found in config. Please configure via /cookie-manager")
 
-        # Parse cookie string
-        self.cookies = {}
-        for item in cookie_string.split('; '):
-            if '=' in item:
-                key, value = item.split('=', 1)
-                self.cookies[key] = value
+        self.cookies = parse_cookie_string(cookie_string)
 
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
+        # Shared session so page fetches reuse pooled keep-alive connections
+        # instead of opening a new one per page
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.headers.update(self.headers)
+        self.session.cookies.update(self.cookies)
+
     def reload_cookie(self):
         """Hot reload cookie from config without restarting scraper"""
         self.config_manager.load_config()
@@ -67,12 +70,10 @@ class IPTorrentsScraper:
         if not cookie_string:
             raise ValueError("Cookie not found in config. Please configure via /cookie-manager")
 
-        # Re-parse cookie string
-        self.cookies = {}
-        for item in cookie_string.split('; '):
-            if '=' in item:
-                key, value = item.split('=', 1)
-                self.cookies[key] = value
+        self.cookies = parse_cookie_string(cookie_string)
+
+        self.session.cookies.clear()
+        self.session.cookies.update(self.cookies)
 
     def fetch_torrents(self, categories=['PC-ISO', 'PC-Rip'], limit=None, days=None):
         """
@@ -84,15 +85,16 @@ class IPTorrentsScraper:
             days: Number of days back to fetch (None = all available, enables multi-page)
 
         Returns:
-            List of torrent dictionaries
+            List of torrent dictionaries (timestamp as epoch seconds)
         """
         all_torrents = []
         cutoff_time = None
 
-        # Calculate cutoff time if days is specified
+        # Calculate cutoff time (epoch seconds) if days is specified
         if days:
-            cutoff_time = datetime.now() - timedelta(days=days)
-            print(f"Fetching torrents from last {days} days (since {cutoff_time.strftime('%Y-%m-%d %H:%M')})")
+            cutoff_dt = datetime.now() - timedelta(days=days)
+            cutoff_time = cutoff_dt.timestamp()
+            print(f"Fetching torrents from last {days} days (since {cutoff_dt.strftime('%Y-%m-%d %H:%M')})")
 
         for idx, category_name in enumerate(categories):
             if category_name not in CATEGORIES:
@@ -122,14 +124,17 @@ class IPTorrentsScraper:
 
         return all_torrents
 
-    def fetch_incremental(self, categories, newest_timestamps):
+    def fetch_incremental(self, categories, newest_timestamps, known_ids=None):
         """
         Fetch only new torrents since the last known timestamp for each category
         This is the "only fetch new things" optimization
 
         Args:
             categories: List of category names to check for updates
-            newest_timestamps: Dict mapping category name -> datetime of newest cached torrent
+            newest_timestamps: Dict mapping category name -> epoch seconds of newest cached torrent
+            known_ids: Optional container of torrent IDs already cached; these are
+                       left out of the result (upload times are relative, so a cached
+                       torrent can reappear just past the cutoff)
 
         Returns:
             List of NEW torrent dictionaries only
@@ -150,12 +155,14 @@ class IPTorrentsScraper:
                 # No cached data for this category, fetch first page only
                 print(f"  {category_name}: No cached data, fetching first page")
                 torrents = self._fetch_single_page(category_name, category_id, offset=0)
+                if known_ids:
+                    torrents = [t for t in torrents if t['id'] not in known_ids]
                 all_new_torrents.extend(torrents)
                 print(f"    Found {len(torrents)} torrents")
             else:
                 # Fetch pages until we hit the cutoff timestamp
-                print(f"  {category_name}: Checking for new torrents since {cutoff_timestamp.strftime('%Y-%m-%d %H:%M')}")
-                torrents = self._fetch_until_timestamp(category_name, category_id, cutoff_timestamp)
+                print(f"  {category_name}: Checking for new torrents since {datetime.fromtimestamp(cutoff_timestamp).strftime('%Y-%m-%d %H:%M')}")
+                torrents = self._fetch_until_timestamp(category_name, category_id, cutoff_timestamp, known_ids)
 
                 all_new_torrents.extend(torrents)
                 if torrents:
@@ -173,7 +180,7 @@ class IPTorrentsScraper:
         print(f"Total new torrents: {len(all_new_torrents)}")
         return all_new_torrents
 
-    def _fetch_until_timestamp(self, category_name, category_id, cutoff_timestamp):
+    def _fetch_until_timestamp(self, category_name, category_id, cutoff_timestamp, known_ids=None):
         """
         Fetch pages until we encounter the cutoff timestamp
         This stops fetching as soon as we hit already-cached torrents
@@ -181,7 +188,8 @@ class IPTorrentsScraper:
         Args:
             category_name: Name of the category
             category_id: ID of the category
-            cutoff_timestamp: datetime - stop when we hit torrents older than this
+            cutoff_timestamp: epoch seconds - stop when we hit torrents older than this
+            known_ids: Optional container of cached torrent IDs to skip
 
         Returns:
             List of new torrent dictionaries
@@ -202,7 +210,9 @@ class IPTorrentsScraper:
             hit_cutoff = False
             for torrent in torrents:
                 if torrent['timestamp'] > cutoff_timestamp:
-                    # This is new! Add it
+                    # This is new! Add it (unless it is already cached)
+                    if known_ids and torrent['id'] in known_ids:
+                        continue
                     new_torrents.append(torrent)
                 else:
                     # We've hit old data, stop fetching this category
@@ -229,10 +239,12 @@ class IPTorrentsScraper:
             url = f"{BASE_URL}/t?{category_id}"
 
         try:
-            response = requests.get(url, cookies=self.cookies, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            torrents = self._parse_torrents(response.text, category_name)
+            # Hand the raw bytes to the parser; it sniffs the charset itself, which
+            # avoids building a decoded copy of the whole page first
+            torrents = self._parse_torrents(response.content, category_name)
             return torrents
 
         except requests.HTTPError as e:
@@ -332,7 +344,9 @@ class IPTorrentsScraper:
 
     def _parse_torrents(self, html, category):
         """Parse HTML and extract torrent data"""
-        soup = BeautifulSoup(html, 'html.parser')
+        # Stick with html.parser: the row parser relies on how it keeps the
+        # site's nested <td> cells (see _parse_torrent_row)
+        soup = BeautifulSoup(html, 'html.parser', parse_only=TORRENT_TABLE_STRAINER)
         torrents = []
 
         # Find the main torrent table
@@ -364,9 +378,25 @@ class IPTorrentsScraper:
         if len(cells) < 5:
             return None
 
-        # Find torrent name and link
-        # The torrent title is usually in a link with href="/t/{id}"
-        title_link = row.find('a', href=lambda x: x and '/t/' in x and not 'bookmark' in x and not 'comment' in x)
+        # Classify the row's links in a single pass instead of re-walking the
+        # row once per link type:
+        # - title: href="/t/{id}" (not the bookmark/comment links)
+        # - IMDB search: href="/t?qf=all;q=tt12345678"
+        # - download: href="/download.php/..."
+        title_link = None
+        imdb_link = None
+        download_link_elem = None
+
+        for link in row.find_all('a', href=True):
+            href = link['href']
+            if title_link is None and '/t/' in href and 'bookmark' not in href and 'comment' not in href:
+                title_link = link
+            if imdb_link is None and '/t?qf=all;q=tt' in href:
+                imdb_link = link
+            if download_link_elem is None and '/download.php/' in href:
+                download_link_elem = link
+            if title_link is not None and imdb_link is not None and download_link_elem is not None:
+                break
 
         if not title_link:
             return None
@@ -375,16 +405,13 @@ class IPTorrentsScraper:
         torrent_id_match = re.search(r'/t/(\d+)', title_link['href'])
         torrent_id = torrent_id_match.group(1) if torrent_id_match else None
 
-        # Extract IMDB ID from search links (pattern: /t?qf=all;q=tt12345678)
+        # Extract IMDB ID from search link
         imdb_id = None
-        imdb_link = row.find('a', href=lambda x: x and '/t?qf=all;q=tt' in x)
         if imdb_link:
             imdb_match = re.search(r'q=(tt\d+)', imdb_link['href'])
             if imdb_match:
                 imdb_id = imdb_match.group(1)
 
-        # Find download link
-        download_link_elem = row.find('a', href=lambda x: x and '/download.php/' in x)
         download_link = BASE_URL + download_link_elem['href'] if download_link_elem else None
 
         # Extract size (look for patterns like "3.5 GB", "1.91 GB", "500 MB")
@@ -435,7 +462,8 @@ class IPTorrentsScraper:
         # Look for patterns like "10.9 hours ago", "1.2 days ago"
         time_match = re.search(r'([\d.]+)\s*(minute|hour|day|week|month)s?\s*ago', size_text, re.IGNORECASE)
 
-        timestamp = datetime.now()
+        # Timestamps are epoch seconds (JSON-native, cheap to compare and sort)
+        timestamp = time.time()
         upload_time = "Unknown"
 
         if time_match:
@@ -445,16 +473,7 @@ class IPTorrentsScraper:
             upload_time = time_match.group(0)
 
             # Calculate timestamp
-            if 'minute' in unit:
-                timestamp = datetime.now() - timedelta(minutes=value)
-            elif 'hour' in unit:
-                timestamp = datetime.now() - timedelta(hours=value)
-            elif 'day' in unit:
-                timestamp = datetime.now() - timedelta(days=value)
-            elif 'week' in unit:
-                timestamp = datetime.now() - timedelta(weeks=value)
-            elif 'month' in unit:
-                timestamp = datetime.now() - timedelta(days=value * 30)
+            timestamp -= value * TIME_UNIT_SECONDS[unit]
 
         # Check for freeleech (usually indicated by special icon or text)
         is_freeleech = bool(row.find(string=re.compile(r'freeleech', re.I)))
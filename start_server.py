@@ -3,6 +3,7 @@ IPTorrents Browser - Network-accessible server launcher
 Shows local IP addresses and starts the Flask server
 """
 
+import logging
 import socket
 import os
 from app import app, load_cache
@@ -51,6 +52,8 @@ def print_banner():
     print()
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
     # Load cache on startup
     load_cache()
 
@@ -615,11 +615,9 @@ function filterByDays(torrents) {
 
     const cutoff = new Date();
     cutoff.setDate(cutoff.getDate() - days);
+    const cutoffSeconds = cutoff.getTime() / 1000;  // timestamps are epoch seconds
 
-    return torrents.filter(t => {
-        const torrentDate = new Date(t.timestamp);
-        return torrentDate >= cutoff;
-    });
+    return torrents.filter(t => t.timestamp >= cutoffSeconds);
 }
 
 function filterByMinSnatched(torrents) {
@@ -907,7 +905,7 @@ function deduplicateMovies(torrents) {
             }
 
             // 3. Upload date (newer first)
-            return new Date(b.timestamp) - new Date(a.timestamp);
+            return b.timestamp - a.timestamp;
         });
 
         // Use the best version as the "main" torrent
@@ -993,7 +991,7 @@ function deduplicateGames(games) {
             }
 
             // 4. Upload date (newer first)
-            return new Date(b.timestamp) - new Date(a.timestamp);
+            return b.timestamp - a.timestamp;
         });
 
         // Use the best version as the "main" torrent
@@ -1048,7 +1046,7 @@ function deduplicateTorrents(torrents) {
             const scoreA = getQualityScore(a.metadata?.quality || '');
             const scoreB = getQualityScore(b.metadata?.quality || '');
             if (scoreB !== scoreA) return scoreB - scoreA;
-            return new Date(b.timestamp) - new Date(a.timestamp);
+            return b.timestamp - a.timestamp;
         });
 
         const mainTorrent = { ...sortedVersions[0] };
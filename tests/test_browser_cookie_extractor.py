@@ -0,0 +1,115 @@
+"""
+Tests for browser_cookie_extractor against small on-disk cookie databases
+
+Run from the repository root: python -m unittest discover tests
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from browser_cookie_extractor import BrowserCookieExtractor
+
+
+class CookieQueryTests(unittest.TestCase):
+    """Cookie lookups bind one name placeholder per required cookie"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _firefox_db(self, rows):
+        path = os.path.join(self.temp_dir, 'cookies.sqlite')
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE moz_cookies (name TEXT, value TEXT, host TEXT)')
+        conn.executemany('INSERT INTO moz_cookies VALUES (?, ?, ?)', rows)
+        conn.commit()
+        conn.close()
+        return path
+
+    def _chromium_db(self, rows):
+        # <User Data>/Default/Network/Cookies, with no Local State (values are unencrypted)
+        network_dir = os.path.join(self.temp_dir, 'User Data', 'Default', 'Network')
+        os.makedirs(network_dir)
+        path = os.path.join(network_dir, 'Cookies')
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE cookies (name TEXT, encrypted_value BLOB, host_key TEXT)')
+        conn.executemany('INSERT INTO cookies VALUES (?, ?, ?)', rows)
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_default_cookies(self):
+        path = self._firefox_db([
+            ('uid', '1', '.iptorrents.com'),
+            ('pass', 'abc', 'www.iptorrents.com'),
+            ('uid', '2', 'example.com'),
+        ])
+
+        result = BrowserCookieExtractor()._extract_firefox_cookies(path, 'test')
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['cookie'], 'uid=1; pass=abc')
+
+    def test_three_required_cookies(self):
+        path = self._firefox_db([
+            ('uid', '1', '.iptorrents.com'),
+            ('pass', 'abc', '.iptorrents.com'),
+            ('session', 'xyz', 'iptorrents.com'),
+        ])
+        extractor = BrowserCookieExtractor(required_cookies=['uid', 'pass', 'session'])
+
+        result = extractor._extract_firefox_cookies(path, 'test')
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['cookie'], 'uid=1; pass=abc; session=xyz')
+
+    def test_single_required_cookie_missing(self):
+        path = self._firefox_db([('pass', 'abc', '.iptorrents.com')])
+        extractor = BrowserCookieExtractor(required_cookies=['uid'])
+
+        result = extractor._extract_firefox_cookies(path, 'test')
+
+        self.assertFalse(result['success'])
+        self.assertIn('No cookies found', result['error'])
+
+    def test_chromium_three_required_cookies(self):
+        path = self._chromium_db([
+            ('uid', b'', '.iptorrents.com'),
+            ('pass', b'', '.iptorrents.com'),
+            ('session', b'', 'www.iptorrents.com'),
+        ])
+        extractor = BrowserCookieExtractor(required_cookies=['uid', 'pass', 'session'])
+
+        result = extractor._extract_chromium_cookies(path, 'Chrome', 'Default')
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['cookie'], 'uid=; pass=; session=')
+
+    def test_uncheckpointed_wal(self):
+        # The browser still has the database open: the table and rows only
+        # exist in the -wal file, which immutable=1 would ignore
+        path = os.path.join(self.temp_dir, 'cookies.sqlite')
+        writer = sqlite3.connect(path, isolation_level=None)
+        self.addCleanup(writer.close)
+        writer.execute('PRAGMA journal_mode=WAL')
+        writer.execute('PRAGMA wal_autocheckpoint=0')
+        writer.execute('CREATE TABLE moz_cookies (name TEXT, value TEXT, host TEXT)')
+        writer.executemany('INSERT INTO moz_cookies VALUES (?, ?, ?)', [
+            ('uid', '1', '.iptorrents.com'),
+            ('pass', 'abc', '.iptorrents.com'),
+        ])
+        self.assertGreater(os.path.getsize(path + '-wal'), 0)
+
+        result = BrowserCookieExtractor()._extract_firefox_cookies(path, 'test')
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['cookie'], 'uid=1; pass=abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
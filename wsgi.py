@@ -0,0 +1,16 @@
+"""
+IPTorrents Browser - WSGI entry point
+Loads the torrent cache and exposes the Flask app for a production WSGI server
+"""
+
+import logging
+
+from app import app, load_cache
+
+# Library modules only create loggers; the entry point configures output
+logging.basicConfig(level=logging.INFO)
+
+# Load cache on startup
+load_cache()
+
+application = app